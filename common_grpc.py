@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Canal e stubs gRPC compartilhados pelos scripts de teste manuais (test_*.py)
+"""
+
+import atexit
+import base64
+import json
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+import grpc
+
+# Stubs gerados em src/GameClient/Generated
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'GameClient', 'Generated'))
+
+import auth_pb2
+import auth_pb2_grpc
+import player_pb2_grpc
+
+# Saída dos scripts via logging (só a mensagem, como o print de antes);
+# LOGLEVEL=WARNING deixa só falhas, sem formatar as mensagens de progresso
+logging.basicConfig(level=os.environ.get('LOGLEVEL', 'INFO').upper(), format='%(message)s')
+log = logging.getLogger(__name__)
+
+SERVER_ADDRESS = 'localhost:5001'
+
+# Conta usada pelos testes de movimento
+TEST_EMAIL = "movetest@test.com"
+TEST_PASSWORD = "password123"
+
+# JWT reaproveitado entre execuções (evita Login + verificação de senha a cada script)
+TOKEN_CACHE_PATH = Path.home() / '.rpg_test_token.json'
+
+# Keepalive: com o canal ocioso uma conexão derrubada (NAT/LB) é detectada
+# pelo PING em vez de travar a próxima RPC em retransmissões TCP
+CHANNEL_OPTIONS = (
+    ('grpc.keepalive_time_ms', 10000),
+    ('grpc.keepalive_timeout_ms', 5000),
+    ('grpc.keepalive_permit_without_calls', 1),
+    ('grpc.http2.max_pings_without_data', 0),
+)
+
+# Um canal por processo, criado no import: os stubs de todos os passos do teste usam a mesma conexão
+CHANNEL = grpc.insecure_channel(SERVER_ADDRESS, options=CHANNEL_OPTIONS)
+AUTH = auth_pb2_grpc.AuthServiceStub(CHANNEL)
+PLAYER = player_pb2_grpc.PlayerServiceStub(CHANNEL)
+
+atexit.register(CHANNEL.close)
+
+def aio_stubs():
+    """Canal grpc.aio e stubs (auth, player). Chamar de dentro do event loop que vai usá-los;
+    o chamador fecha o canal (async with channel)."""
+    channel = grpc.aio.insecure_channel(SERVER_ADDRESS, options=CHANNEL_OPTIONS)
+    return channel, auth_pb2_grpc.AuthServiceStub(channel), player_pb2_grpc.PlayerServiceStub(channel)
+
+def _jwt_exp(token):
+    """Claim exp do JWT (sem validar assinatura)."""
+    payload = token.split('.')[1]
+    payload += '=' * (-len(payload) % 4)
+    return json.loads(base64.urlsafe_b64decode(payload)).get('exp', 0)
+
+def get_token(email=TEST_EMAIL, password=TEST_PASSWORD, create_account=False):
+    """JWT da conta de teste. Usa o cache enquanto faltar mais de 60s para expirar;
+    senão faz Login (com create_account, cria a conta se o login falhar) e regrava o cache.
+    Lança RuntimeError com a mensagem do servidor se o login falhar."""
+    try:
+        cached = json.loads(TOKEN_CACHE_PATH.read_text())
+        if cached['email'] == email and _jwt_exp(cached['jwt_token']) - time.time() > 60:
+            return cached['jwt_token']
+    except (OSError, ValueError, KeyError, IndexError):
+        pass
+
+    login_request = auth_pb2.LoginRequest(email=email, password=password)
+    login_response = AUTH.Login(login_request)
+    if not login_response.success and create_account:
+        log.info("Login falhou, criando nova conta...")
+        create_response = AUTH.CreateAccount(auth_pb2.CreateAccountRequest(email=email, password=password))
+        if create_response.success:
+            login_response = AUTH.Login(login_request)
+    if not login_response.success:
+        raise RuntimeError(login_response.message)
+
+    # Escrita atômica: outro script rodando em paralelo nunca lê o arquivo pela metade.
+    # 0o600: o JWT dá acesso à conta, só o dono lê (como o token store do cliente)
+    tmp_path = TOKEN_CACHE_PATH.with_suffix('.tmp')
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'w') as f:
+        json.dump({'email': email, 'jwt_token': login_response.jwt_token}, f)
+    os.replace(tmp_path, TOKEN_CACHE_PATH)
+    return login_response.jwt_token
+
+def drop_token():
+    """Apaga o JWT em cache (ex: recusado pelo servidor); o próximo get_token() faz Login."""
+    try:
+        TOKEN_CACHE_PATH.unlink()
+    except FileNotFoundError:
+        pass
+
+def renew_token(email=TEST_EMAIL, password=TEST_PASSWORD):
+    """Para quando o servidor recusa o JWT do cache (UNAUTHENTICATED): descarta o
+    cache e faz Login de novo. Mesmas exceções de get_token()."""
+    log.warning("⚠️ JWT do cache recusado pelo servidor, fazendo login de novo...")
+    drop_token()
+    return get_token(email, password)
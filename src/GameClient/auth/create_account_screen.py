@@ -1,6 +1,6 @@
 import pygame
 from .ui_components import InputBox, Button
-from ..grpc_client import grpc_client
+from ..grpc_client import get_client
 
 class CreateAccountScreen:
     def __init__(self, game):
@@ -38,8 +38,13 @@ class CreateAccountScreen:
             self.show_message("Passwords do not match!", "error")
             return
 
+        # Conexão ainda em andamento (em segundo plano): não trava o frame
+        if not get_client().is_connected():
+            self.show_message("Connecting to server... please try again.", "error")
+            return
+
         try:
-            response = grpc_client.create_account(email, password)
+            response = get_client().create_account(email, password)
             if response.success:
                 self.show_message("Account created! Please login.", "success")
             else:
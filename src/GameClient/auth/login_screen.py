@@ -1,6 +1,6 @@
 import pygame
 from .ui_components import InputBox, Button
-from ..grpc_client import grpc_client
+from ..grpc_client import get_client
 
 class LoginScreen:
     def __init__(self, game):
@@ -30,8 +30,12 @@ class LoginScreen:
     def attempt_login(self):
         email = self.email_box.text
         password = self.password_box.text
+        # Conexão ainda em andamento (em segundo plano): não trava o frame no login
+        if not get_client().is_connected():
+            self.show_error("Connecting to server... please try again.")
+            return
         try:
-            response = grpc_client.login(email, password)
+            response = get_client().login(email, password)
             if response.success:
                 print(f"Login successful! Token: {response.jwt_token}")
                 self.game.switch_state("char_select", token=response.jwt_token)
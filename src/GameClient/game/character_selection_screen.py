@@ -1,6 +1,6 @@
 import pygame
 from ..auth.ui_components import Button
-from ..grpc_client import grpc_client
+from ..grpc_client import get_client
 
 class CharacterSelectionScreen:
     def __init__(self, game):
@@ -22,7 +22,7 @@ class CharacterSelectionScreen:
         self.selected_character_index = None  # Ensure no character is selected
         
         try:
-            response = grpc_client.get_players(self.game.auth_token)
+            response = get_client().get_players(self.game.auth_token)
             if response.players:
                 self.characters = list(response.players)
                 print(f"Loaded {len(self.characters)} characters")
@@ -44,7 +44,7 @@ class CharacterSelectionScreen:
 
         if self.logout_button.is_clicked(event):
             try:
-                grpc_client.logout()
+                get_client().logout()
             except Exception as ex:
                 print(f"Logout error: {ex}")
             self.game.auth_token = None
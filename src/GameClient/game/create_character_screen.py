@@ -1,6 +1,6 @@
 import pygame
 from GameClient.auth.ui_components import Button
-from GameClient.grpc_client import grpc_client
+from GameClient.grpc_client import get_client
 
 class CreateCharacterScreen:
     def __init__(self, game):
@@ -71,7 +71,7 @@ class CreateCharacterScreen:
             self.error_message = ""
             self.success_message = ""
             
-            response = grpc_client.create_character(
+            response = get_client().create_character(
                 self.game.auth_token, 
                 self.character_name.strip(), 
                 self.selected_vocation
@@ -1,4 +1,5 @@
 import pygame
+import logging
 import time
 import uuid
 import queue
@@ -7,8 +8,15 @@ from typing import Optional
 from .world import GameMap
 from .entities import Entity, EntityManager, EntityType, MovementState
 from .ui import Camera, UI
-from ..grpc_client import grpc_client
-from ..world_client import world_client
+from ..grpc_client import get_client
+from ..world_client import get_world_client
+
+# Diagnóstico por frame/mensagem (sincronização, snapshots): só com DEBUG habilitado
+logger = logging.getLogger(__name__)
+
+# Máximo de updates de entidades aplicados por frame; o resto fica para os próximos
+# (o buffer do WorldClient descarta os mais antigos e sinaliza overflow)
+WORLD_UPDATES_PER_FRAME = 32
 
 class GameScreen:
     def __init__(self, game):
@@ -41,11 +49,12 @@ class GameScreen:
         
         # Thread control for world updates
         self.world_updates_running = False
-        self.world_entity_updates_running = False
         
         # Thread-safe queue for world updates
         self.world_updates_queue = queue.Queue()
-        self.world_entity_updates_queue = queue.Queue()
+        
+        # Interações com entidades do frame atual, enviadas juntas num BatchInteract
+        self._pending_interactions = []
         
         # Initialize world
         self._initialize_world()
@@ -90,12 +99,13 @@ class GameScreen:
         # Load world entities from server
         self._load_world_entities()
 
-    def _load_world_entities(self):
-        """Load NPCs, monsters, and items from server"""
+    def _load_world_entities(self, response=None):
+        """Load NPCs, monsters, and items from server
+        response: snapshot já disponível (ex: cache do world_client); sem ele faz a RPC."""
         try:
-            print("🌍 Loading world entities from server...")
-            
-            response = world_client.get_world_entities()
+            if response is None:
+                print("🌍 Loading world entities from server...")
+                response = get_world_client().get_world_entities()
             
             # Clear existing NPCs and monsters (keep only players)
             self._cleanup_world_entities()
@@ -211,11 +221,7 @@ class GameScreen:
             except:
                 break
                 
-        while not self.world_entity_updates_queue.empty():
-            try:
-                self.world_entity_updates_queue.get_nowait()
-            except:
-                break
+        get_world_client().world_updates.clear()
         
         # Remove all remote players (keep local player, NPCs, monsters)
         self._cleanup_remote_players()
@@ -293,7 +299,7 @@ class GameScreen:
                 # Leave world before going back to character selection
                 if hasattr(self.game, 'auth_token') and self.game.auth_token:
                     try:
-                        response = grpc_client.leave_world(self.game.auth_token)
+                        response = get_client().leave_world(self.game.auth_token)
                         if response.success:
                             self.ui.add_chat_message(f"🚪 {response.message}")
                             print(f"🚪 Left world: {response.message}")
@@ -402,7 +408,7 @@ class GameScreen:
                     self.ui.add_chat_message("⚠️ PlayerId indisponível para coleta")
                     return
                 # Chama PlayerService diretamente para pegar item
-                response = grpc_client.pick_up_item(
+                response = get_client().pick_up_item(
                     self.game.auth_token,
                     player_id=player_id,
                     item_id=item_entity.id
@@ -452,47 +458,60 @@ class GameScreen:
                 self.ui.add_chat_message(f"Attacking {target.name}!")
     
     def _attack_world_entity(self, target: Entity):
-        """Attack a world entity (monster/NPC) via server"""
+        """Attack a world entity (monster/NPC) via server
+        O ataque é enfileirado e enviado no fim do frame (_flush_entity_interactions)."""
+        if hasattr(self.game, 'auth_token') and self.game.auth_token:
+            print(f"🗡️ Attacking {target.name} (ID: {target.id}) via server...")
+            self._pending_interactions.append((
+                target.id,
+                "attack",
+                {
+                    "player_attack": str(self.local_player.stats.attack),
+                    "player_level": str(self.local_player.stats.level)
+                }
+            ))
+    
+    def _flush_entity_interactions(self):
+        """Send all interactions queued this frame in a single BatchInteract"""
+        if not self._pending_interactions:
+            return
+        interactions, self._pending_interactions = self._pending_interactions, []
+        world_client = get_world_client()
         try:
-            if hasattr(self.game, 'auth_token') and self.game.auth_token:
-                print(f"🗡️ Attacking {target.name} (ID: {target.id}) via server...")
-                
-                # Send attack request to server
-                response = world_client.interact_with_entity(
-                    entity_id=target.id,
-                    interaction_type="attack",
-                    parameters={
-                        "player_attack": str(self.local_player.stats.attack),
-                        "player_level": str(self.local_player.stats.level)
-                    }
-                )
-                
-                if response.success:
-                    self.ui.add_chat_message(f"⚔️ {response.message}")
-                    
-                    # Update affected entities
-                    for entity_data in response.affected_entities:
-                        self._update_entity_from_server_data(entity_data)
-                    
-                    # Process rewards (XP, items, etc.)
-                    if response.rewards:
-                        for reward_type, reward_value in response.rewards.items():
-                            if reward_type == "experience":
-                                exp_gained = int(reward_value)
-                                self.local_player.stats.experience += exp_gained
-                                self.ui.add_chat_message(f"✨ Gained {exp_gained} experience!")
-                                self._check_level_up()
-                                self._sync_player_stats_to_server()
-                            elif reward_type == "gold":
-                                gold_gained = int(reward_value)
-                                self.ui.add_chat_message(f"💰 Gained {gold_gained} gold!")
-                else:
-                    self.ui.add_chat_message(f"❌ {response.message}")
-                    
+            if len(interactions) == 1:
+                responses = (world_client.interact_with_entity(*interactions[0]),)
+            else:
+                responses = world_client.interact_with_entities(interactions)
+            for response in responses:
+                self._handle_attack_response(response)
         except Exception as e:
             print(f"❌ Error attacking entity: {e}")
             self.ui.add_chat_message("⚠️ Attack failed - server error")
     
+    def _handle_attack_response(self, response):
+        """Apply an attack InteractWithEntityResponse (affected entities, rewards)"""
+        if response.success:
+            self.ui.add_chat_message(f"⚔️ {response.message}")
+            
+            # Update affected entities
+            for entity_data in response.affected_entities:
+                self._update_entity_from_server_data(entity_data)
+            
+            # Process rewards (XP, items, etc.)
+            if response.rewards:
+                for reward_type, reward_value in response.rewards.items():
+                    if reward_type == "experience":
+                        exp_gained = int(reward_value)
+                        self.local_player.stats.experience += exp_gained
+                        self.ui.add_chat_message(f"✨ Gained {exp_gained} experience!")
+                        self._check_level_up()
+                        self._sync_player_stats_to_server()
+                    elif reward_type == "gold":
+                        gold_gained = int(reward_value)
+                        self.ui.add_chat_message(f"💰 Gained {gold_gained} gold!")
+        else:
+            self.ui.add_chat_message(f"❌ {response.message}")
+    
     def _update_entity_from_server_data(self, entity_data):
         """Update a local entity with data from server"""
         entity = self.entity_manager.get_entity(entity_data.id)
@@ -584,7 +603,7 @@ class GameScreen:
             return False
         
         try:
-            response = grpc_client.update_player_stats(
+            response = get_client().update_player_stats(
                 self.game.auth_token,
                 level=self.local_player.stats.level,
                 experience=self.local_player.stats.experience,
@@ -613,7 +632,7 @@ class GameScreen:
         
         try:
             # Send position and all relevant state info
-            response = grpc_client.update_player_position(
+            response = get_client().update_player_position(
                 self.game.auth_token,
                 position_x=self.local_player.x,
                 position_y=self.local_player.y,
@@ -622,7 +641,9 @@ class GameScreen:
             )
             
             if response and response.success:
-                print(f"📍 Position synced to server: ({self.local_player.x:.0f}, {self.local_player.y:.0f}), facing={self.local_player.facing_direction}, state={self.local_player.movement_state}")
+                logger.debug("📍 Position synced to server: (%.0f, %.0f), facing=%s, state=%s",
+                             self.local_player.x, self.local_player.y,
+                             self.local_player.facing_direction, self.local_player.movement_state)
                 return True
             else:
                 error_msg = response.message if response else "No response from server"
@@ -781,6 +802,9 @@ class GameScreen:
         # Process world entity updates from streaming thread
         self._process_world_entity_updates()
         
+        # Send entity interactions queued by input handling
+        self._flush_entity_interactions()
+        
         # Handle continuous movement (check pressed keys)
         self._handle_continuous_movement()
         
@@ -941,7 +965,7 @@ class GameScreen:
                 else:
                     print("🔍 DEBUG: No selected character found, using default")
                 
-                response = grpc_client.join_world(self.game.auth_token, player_id=player_id)
+                response = get_client().join_world(self.game.auth_token, player_id=player_id)
                 print(f"🔍 DEBUG: join_world response: success={response.success}, message={response.message}")
                 if response.success:
                     self.ui.add_chat_message(f"🌍 {response.message}")
@@ -1019,7 +1043,8 @@ class GameScreen:
         # Process the movement
         self._process_movement(new_x, new_y, movement_type)
         
-        print(f"🎮 Arrow key movement: direction=({dx},{dy}), new_pos=({new_x:.0f},{new_y:.0f}), type={movement_type}")
+        logger.debug("🎮 Arrow key movement: direction=(%s,%s), new_pos=(%.0f,%.0f), type=%s",
+                     dx, dy, new_x, new_y, movement_type)
     
     def _process_movement(self, target_x: float, target_y: float, movement_type: str = "walk"):
         """Process movement to target position"""
@@ -1055,7 +1080,7 @@ class GameScreen:
         """Send movement command to server"""
         try:
             if hasattr(self.game, 'auth_token') and self.game.auth_token:
-                response = grpc_client.move_player(
+                response = get_client().move_player(
                     self.game.auth_token, 
                     target_x, 
                     target_y, 
@@ -1104,7 +1129,7 @@ class GameScreen:
                     existing_entity.stats.max_hp = player_info.max_hp
                     existing_entity.facing_direction = player_info.facing_direction
                     existing_entity.movement_state = player_info.movement_state
-                    print(f"🔄 Updated remote player: {player_info.name}")
+                    logger.debug("🔄 Updated remote player: %s", player_info.name)
                 else:
                     # Create new remote player entity
                     remote_player = Entity(
@@ -1152,10 +1177,9 @@ class GameScreen:
     
     def _world_updates_worker(self):
         """Worker thread for polling world updates"""
-        import time
-        
         try:
             print("🔄 Starting world updates polling...")
+            last_world_state = None
             
             while self.world_updates_running:
                 try:
@@ -1164,13 +1188,20 @@ class GameScreen:
                         break
                     
                     # Poll for world state every 100ms (10 FPS)
-                    world_state = grpc_client.get_world_state(self.game.auth_token)
+                    world_state = get_client().get_world_state(self.game.auth_token)
+                    
+                    # Com o StreamWorldState o cliente devolve o mesmo snapshot até o
+                    # servidor enviar uma mudança: nada a reaplicar
+                    if world_state is not None and world_state is last_world_state:
+                        time.sleep(0.1)
+                        continue
+                    last_world_state = world_state
                     
                     if world_state and world_state.players:
-                        print(f"🌍 Received world state with {len(world_state.players)} players")
+                        logger.debug("🌍 Received world state with %d players", len(world_state.players))
                         self._update_remote_players(world_state.players)
                     else:
-                        print(f"🌍 Received empty world state")
+                        logger.debug("🌍 Received empty world state")
                         # Clear all remote players if no players in world state
                         self._clear_all_remote_players()
                     
@@ -1238,7 +1269,8 @@ class GameScreen:
                     existing_entity.movement_state = player_info.movement_state
                     existing_entity.stats.hp = player_info.current_hp
                     existing_entity.stats.level = player_info.level
-                    print(f"🔄 Updated remote player {player_info.name} position: ({player_info.position_x}, {player_info.position_y})")
+                    logger.debug("🔄 Updated remote player %s position: (%s, %s)",
+                                 player_info.name, player_info.position_x, player_info.position_y)
                 else:
                     # Create new remote player if not exists
                     self._add_other_players([player_info])
@@ -1280,41 +1312,26 @@ class GameScreen:
             return
             
         try:
-            # Set flag to start thread
-            self.world_entity_updates_running = True
-            
-            # Start world entity updates in a separate thread
-            threading.Thread(target=self._world_entity_updates_worker, daemon=True).start()
+            # Stream is consumed by WorldClient's own thread into world_client.world_updates
+            get_world_client().start_world_updates()
             print("🌍 Started world entity updates stream")
         except Exception as e:
             print(f"❌ Failed to start world entity updates: {e}")
     
-    def _world_entity_updates_worker(self):
-        """Worker thread for world entity updates streaming"""
-        try:
-            print("🌍 Starting world entity updates stream...")
-            
-            # Get the stream from server
-            stream = world_client.get_world_updates_stream()
-            
-            for update in stream:
-                # Check if we should still be running
-                if not self.world_entity_updates_running:
-                    break
-                
-                # Put update in queue for main thread processing
-                self.world_entity_updates_queue.put(update)
-                
-        except Exception as e:
-            print(f"❌ World entity updates stream error: {e}")
-        finally:
-            print("🌍 World entity updates stream ended")
-    
     def _process_world_entity_updates(self):
-        """Process world entity updates from the queue (called from main thread)"""
+        """Drain world entity updates buffered by the stream thread (called from main thread)"""
+        world_client = get_world_client()
+        updates = world_client.world_updates
+        if world_client.world_updates_overflowed:
+            # Oldest deltas were dropped; resync from the client-side cache
+            # (kept current by the stream thread), falling back to a full snapshot
+            world_client.world_updates_overflowed = False
+            updates.clear()
+            self._load_world_entities(world_client.cached_world_entities())
+            return
         try:
-            while not self.world_entity_updates_queue.empty():
-                update = self.world_entity_updates_queue.get_nowait()
+            for _ in range(min(len(updates), WORLD_UPDATES_PER_FRAME)):
+                update = updates.popleft()
                 
                 # Process updated entities
                 for entity_data in update.updated_entities:
@@ -1336,13 +1353,11 @@ class GameScreen:
                         self.entity_manager.remove_entity(removed_id)
                         print(f"➖ Removed entity: {entity.name}")
                 
-        except queue.Empty:
-            pass
         except Exception as e:
             print(f"❌ Error processing world entity updates: {e}")
     
     def _stop_all_updates(self):
         """Stop all update streams"""
         self.world_updates_running = False
-        self.world_entity_updates_running = False
+        get_world_client().stop_world_updates()
         print("🛑 All update streams stopped")
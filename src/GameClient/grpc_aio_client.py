@@ -0,0 +1,143 @@
+import asyncio
+import threading
+
+import grpc
+from grpc import aio
+
+from .Generated import world_pb2, world_pb2_grpc
+from .grpc_client import (GrpcClient, CHANNEL_OPTIONS, CONNECT_TIMEOUT, logger,
+                          auth_pb2, auth_pb2_grpc, player_pb2, player_pb2_grpc)
+
+# Requests sem campos: uma instância compartilhada por tipo (não mutar)
+_GET_WORLD_STATE_REQUEST = player_pb2.GetWorldStateRequest()
+_WORLD_UPDATE_REQUEST = world_pb2.WorldUpdateRequest()
+
+
+class _AioAuthInterceptorBase:
+    """Equivalente aio do AuthInterceptor: injeta o header de autorização da sessão."""
+
+    # No aio o nome do método chega em bytes
+    _PUBLIC_PREFIX = b'/auth.AuthService/'
+
+    def __init__(self, sync_client):
+        self._sync = sync_client
+
+    async def _auth_metadata(self):
+        metadata = self._sync.cached_auth_metadata()
+        if metadata is None:
+            # JWT precisa de refresh (RPC síncrona): roda fora do event loop
+            metadata = await asyncio.get_running_loop().run_in_executor(
+                None, self._sync.authenticated_metadata)
+        return metadata
+
+    async def _with_auth(self, client_call_details):
+        if client_call_details.method.startswith(self._PUBLIC_PREFIX):
+            return client_call_details
+        metadata = tuple(client_call_details.metadata or ())
+        if any(key == 'authorization' for key, _ in metadata):
+            return client_call_details
+        return client_call_details._replace(
+            metadata=aio.Metadata(*metadata, *await self._auth_metadata()))
+
+
+# Uma classe por tipo de RPC: o canal aio classifica cada interceptor por um único
+# isinstance, então uma classe com as duas bases só seria usada nas chamadas unárias
+class _AioUnaryAuthInterceptor(_AioAuthInterceptorBase, aio.UnaryUnaryClientInterceptor):
+
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        return await continuation(await self._with_auth(client_call_details), request)
+
+
+class _AioStreamAuthInterceptor(_AioAuthInterceptorBase, aio.UnaryStreamClientInterceptor):
+
+    async def intercept_unary_stream(self, continuation, client_call_details, request):
+        return await continuation(await self._with_auth(client_call_details), request)
+
+
+class AsyncGrpcClient:
+    """Stubs grpc.aio num único canal multiplexado pelo event loop.
+    Tokens, refresh e token store ficam no GrpcClient síncrono compartilhado."""
+
+    def __init__(self, sync_client):
+        self._sync = sync_client
+        self.channel = aio.insecure_channel(
+            sync_client.server_address, options=CHANNEL_OPTIONS,
+            interceptors=[_AioUnaryAuthInterceptor(sync_client), _AioStreamAuthInterceptor(sync_client)])
+        self.auth_stub = auth_pb2_grpc.AuthServiceStub(self.channel)
+        self.player_stub = player_pb2_grpc.PlayerServiceStub(self.channel)
+        self.world_stub = world_pb2_grpc.WorldServiceStub(self.channel)
+
+    async def _call(self, method, request, name, expect=True, **kwargs):
+        """Mesmo tratamento de erro do GrpcClient._call, para chamadas aio."""
+        try:
+            return await method(request, **kwargs)
+        except grpc.RpcError as e:
+            logger.error("gRPC error in %s: %s - %s", name, e.code(), e.details())
+            if expect:
+                raise
+        except Exception as e:
+            logger.error("Error in %s: %s", name, e)
+            if expect:
+                raise
+        return None
+
+    async def login(self, email, password):
+        request = auth_pb2.LoginRequest(email=email, password=password)
+        logger.info("Sending login request for: %s", email)
+        response = await self._call(self.auth_stub.Login, request, 'login',
+                                    wait_for_ready=True, timeout=CONNECT_TIMEOUT)
+        self._sync.store_login(response)
+        return response
+
+    async def move_player(self, target_x, target_y, movement_type="walk"):
+        request = player_pb2.PlayerMoveRequest(
+            target_x=float(target_x), target_y=float(target_y), movement_type=movement_type)
+        return await self._call(self.player_stub.MovePlayer, request, 'move_player')
+
+    async def update_player_position(self, position_x=None, position_y=None, facing_direction=None, movement_state=None):
+        request = GrpcClient.fill_position(
+            player_pb2.PlayerActionRequest(action_type="update_position"),
+            position_x, position_y, facing_direction, movement_state)
+        return await self._call(self.player_stub.PerformAction, request, 'update_player_position', expect=False)
+
+    async def get_world_state(self):
+        return await self._call(self.player_stub.GetWorldState, _GET_WORLD_STATE_REQUEST,
+                                'get_world_state', expect=False)
+
+    async def get_world_updates(self):
+        """Itera o stream GetWorldUpdates do WorldService (async for)."""
+        async for response in self.world_stub.GetWorldUpdates(_WORLD_UPDATE_REQUEST):
+            yield response
+
+    async def close(self):
+        await self.channel.close()
+
+
+class AioGrpcClient(GrpcClient):
+    """GrpcClient cujas RPCs do loop de jogo rodam via grpc.aio num event loop próprio.
+    Fachada síncrona para as telas existentes; ativado com GRPC_USE_AIO=1."""
+
+    def __init__(self, server_address=None):
+        super().__init__(server_address)
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+        # O canal aio precisa ser criado dentro do loop que vai usá-lo
+        self.aio = self.run_async(self._create_aio())
+
+    async def _create_aio(self):
+        return AsyncGrpcClient(self)
+
+    def run_async(self, coro, timeout=None):
+        """Executa uma corrotina no loop do cliente e espera o resultado."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result(timeout)
+
+    def login(self, email, password):
+        return self.run_async(self.aio.login(email, password))
+
+    def move_player(self, token, target_x, target_y, movement_type="walk"):
+        """Parâmetro token mantido apenas por compatibilidade (autenticação via interceptor)."""
+        return self.run_async(self.aio.move_player(target_x, target_y, movement_type))
+
+    def close(self):
+        self.run_async(self.aio.close())
+        super().close()
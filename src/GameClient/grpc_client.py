@@ -1,7 +1,13 @@
 import grpc
+import atexit
+import logging
+import queue
 import threading
+import functools
+import itertools
 import os
 import sys
+import weakref
 
 # Adicionar o diretório Generated ao path para imports absolutos
 current_dir = os.path.dirname(__file__)
@@ -10,32 +16,288 @@ sys.path.insert(0, generated_dir)
 
 import auth_pb2_grpc, auth_pb2
 import player_pb2_grpc, player_pb2
-import json, time, pathlib
+import base64, json, time, pathlib
+
+try:
+    import msgpack
+except ImportError:  # sem msgpack o token store continua em JSON
+    msgpack = None
 
 TOKEN_STORE_PATH = pathlib.Path.home() / '.rpg_client_tokens.json'
 
+# Requests sem campos (a identidade vem do JWT): uma instância compartilhada por tipo.
+# Não devem ser mutados; o stub apenas os serializa.
+_LIST_CHARACTERS_REQUEST = player_pb2.ListCharactersRequest()
+_LEAVE_WORLD_REQUEST = player_pb2.LeaveWorldRequest()
+_GET_WORLD_STATE_REQUEST = player_pb2.GetWorldStateRequest()
+
+# Diagnóstico do cliente: INFO por padrão; GRPC_CLIENT_LOG=DEBUG mostra o detalhe por RPC
+# (valor inválido cai para INFO). Handlers/formato ficam com a aplicação (ver main.py)
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.getLevelNamesMapping().get(os.getenv('GRPC_CLIENT_LOG', 'INFO').upper(), logging.INFO))
+
+# O servidor deriva o account ID do próprio JWT; o header x-account-id (que exige
+# decodificar o payload no cliente) só é enviado com RPG_SEND_ACCOUNT_ID=1
+SEND_ACCOUNT_ID_HEADER = os.getenv('RPG_SEND_ACCOUNT_ID', '0') == '1'
+
+# Antecedência (s) com que o JWT é renovado em segundo plano antes de expirar
+TOKEN_REFRESH_MARGIN = 60
+
+# Tempo máximo (s) que as RPCs de entrada esperam o canal ficar pronto
+CONNECT_TIMEOUT = 2.0
+
+# Deadline (s) das RPCs de sessão, incluindo a espera por (re)conexão do canal.
+# As RPCs de tempo real (movimento/ações/estado) continuam falhando rápido.
+SESSION_RPC_TIMEOUT = 10.0
+
+# Intervalo (ms) dos pings de keepalive HTTP/2, inclusive com o canal ocioso
+KEEPALIVE_MS = int(os.getenv('GRPC_KEEPALIVE_MS', '10000'))
+
+# Canais HTTP/2 independentes usados em round-robin pelas RPCs do cliente
+CHANNEL_POOL_SIZE = int(os.getenv('GRPC_CHANNEL_POOL_SIZE', '4'))
+
+# Liga o cliente grpc.aio (grpc_aio_client.AioGrpcClient) em get_client()
+USE_AIO = os.getenv('GRPC_USE_AIO', '0') == '1'
+
+# Options HTTP/2 comuns aos canais do cliente (síncrono e aio)
+CHANNEL_OPTIONS = (
+    ('grpc.keepalive_time_ms', KEEPALIVE_MS),
+    ('grpc.keepalive_timeout_ms', 5000),
+    ('grpc.keepalive_permit_without_calls', 1),
+    # 0 = sem limite: o stream do mundo fica ocioso por longos períodos
+    # e precisa continuar pingando para detectar conexões mortas
+    ('grpc.http2.max_pings_without_data', 0),
+    ('grpc.http2.min_time_between_pings_ms', KEEPALIVE_MS),
+    ('grpc.http2.min_ping_interval_without_data_ms', KEEPALIVE_MS),
+    ('grpc.initial_reconnect_backoff_ms', 200),
+    ('grpc.max_reconnect_backoff_ms', 5000),
+    # Janela de flow control ajustada pelo BDP e frames maiores: snapshots grandes do
+    # mundo chegam com menos WINDOW_UPDATEs
+    ('grpc.http2.bdp_probe', 1),
+    ('grpc.http2.max_frame_size', 16384 * 16),
+    # Snapshots do mundo crescem com o número de jogadores (padrão do gRPC é 4 MB)
+    ('grpc.max_receive_message_length', 16 * 1024 * 1024),
+)
+
+# Janela (s) em que chamadas repetidas de get_world_state reutilizam a última resposta
+WORLD_STATE_TTL = 0.05
+
+# Espera máxima (s) entre tentativas de reabrir o StreamWorldState / PerformActionStream
+WORLD_STATE_STREAM_MAX_BACKOFF = 5.0
+
+# Intervalo mínimo (s) entre envios no PerformActionStream: atualizações que chegam
+# nesse meio-tempo são fundidas numa só (~20 Hz)
+ACTION_SEND_INTERVAL = 0.05
+
+# Resposta imediata das atualizações enfileiradas no PerformActionStream (somente leitura)
+_ACTION_QUEUED = player_pb2.PlayerActionResponse(success=True, message="Action queued")
+# Classe das ações já resolvida no módulo (update_player_* roda a cada tick)
+_PlayerActionRequest = player_pb2.PlayerActionRequest
+_NOTHING_QUEUED = object()
+
+# Mensagens protobuf reutilizáveis por thread (evita reconstruir a cada chamada)
+_tls = threading.local()
+
+def _reusable_request(slot, factory):
+    """Retorna o protótipo da thread atual para `slot`, criando-o na primeira vez."""
+    req = getattr(_tls, slot, None)
+    if req is None:
+        req = factory()
+        setattr(_tls, slot, req)
+    return req
+
+class AuthInterceptor(grpc.UnaryUnaryClientInterceptor, grpc.UnaryStreamClientInterceptor,
+                      grpc.StreamUnaryClientInterceptor):
+    """Injeta o header de autorização da sessão nas chamadas que não trazem um.
+    Com on_unauthenticated, RPCs unárias recusadas com UNAUTHENTICATED são repetidas
+    uma vez se o callback (recebendo o metadata recusado) conseguir um token novo."""
+
+    # Serviço de autenticação emite os tokens; não exige JWT
+    _PUBLIC_PREFIX = '/auth.AuthService/'
+
+    def __init__(self, metadata_provider, on_unauthenticated=None):
+        self._metadata_provider = metadata_provider
+        self._on_unauthenticated = on_unauthenticated
+
+    def _with_auth(self, client_call_details):
+        if client_call_details.method.startswith(self._PUBLIC_PREFIX):
+            return client_call_details
+        metadata = client_call_details.metadata
+        if not metadata:
+            # Caso comum: repassa a tupla pré-montada em set_token, sem copiar
+            return client_call_details._replace(metadata=self._metadata_provider())
+        if any(key == 'authorization' for key, _ in metadata):
+            return client_call_details
+        return client_call_details._replace(metadata=(*metadata, *self._metadata_provider()))
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        details = self._with_auth(client_call_details)
+        outcome = continuation(details, request)
+        # Só repete chamadas bloqueantes (já concluídas) cujo header foi injetado aqui;
+        # .future() segue assíncrono e sem retry
+        if (self._on_unauthenticated is not None and details is not client_call_details
+                and outcome.done() and outcome.code() is grpc.StatusCode.UNAUTHENTICATED
+                and self._on_unauthenticated(details.metadata)):
+            outcome = continuation(self._with_auth(client_call_details), request)
+        return outcome
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        return continuation(self._with_auth(client_call_details), request)
+
+    def intercept_stream_unary(self, continuation, client_call_details, request_iterator):
+        return continuation(self._with_auth(client_call_details), request_iterator)
+
+class _ChannelPool:
+    """Canais com conexões próprias (sem compartilhar subchannel) e stubs em round-robin."""
+
+    def __init__(self, server_address, options, interceptor, size):
+        self.channels = []
+        stubs = []
+        options = (*options, ('grpc.use_local_subchannel_pool', 1))
+        for _ in range(max(1, size)):
+            raw = grpc.insecure_channel(server_address, options=options)
+            channel = grpc.intercept_channel(raw, interceptor)
+            self.channels.append(channel)
+            stubs.append((auth_pb2_grpc.AuthServiceStub(channel), player_pb2_grpc.PlayerServiceStub(channel)))
+        # cycle.__next__ é atômico sob o GIL: dispensa lock no caminho quente
+        self.next_stubs = itertools.cycle(stubs).__next__
+        # RPCs do loop de jogo já ligadas a cada stub (sem getattr no stub por chamada)
+        player_stubs = [player_stub for _, player_stub in stubs]
+        self.next_move_player = itertools.cycle([s.MovePlayer for s in player_stubs]).__next__
+        self.next_perform_action = itertools.cycle([s.PerformAction for s in player_stubs]).__next__
+        self.next_get_world_state = itertools.cycle([s.GetWorldState for s in player_stubs]).__next__
+        # Inicia a conexão de todos os canais em segundo plano
+        self.ready_futures = [grpc.channel_ready_future(c) for c in self.channels]
+        # Estado de conectividade atual de cada canal, mantido por push. Inscrito depois
+        # dos futures, que já pediram a conexão: um try_to_connect pendente na thread de
+        # polling do gRPC faria ela consultar o canal depois do close()
+        self.states = [grpc.ChannelConnectivity.IDLE] * len(self.channels)
+        for index, channel in enumerate(self.channels):
+            channel.subscribe(functools.partial(self._on_state_change, index))
+
+    def _on_state_change(self, index, state):
+        self.states[index] = state
+
+    def is_ready(self):
+        """Algum canal está READY agora (cai para False quando a conexão é perdida)."""
+        return grpc.ChannelConnectivity.READY in self.states
+
+    def reconnect(self):
+        """Pede nova conexão aos canais que não estão tentando conectar.
+        Canais e stubs são mantidos; só a conexão HTTP/2 subjacente é refeita."""
+        self.ready_futures = [future if not future.done() else grpc.channel_ready_future(channel)
+                              for future, channel in zip(self.ready_futures, self.channels)]
+
+    def close(self):
+        for channel in self.channels:
+            channel.close()
+
+class _IdMap(dict):
+    """WorldEntityId -> ItemId; IDs não mapeados resolvem para si mesmos.
+    Só a indexação usa __missing__ (get e `in` seguem a semântica normal de dict)."""
+
+    def __missing__(self, key):
+        return key
+
+# Pools herdados por processos filhos: mantidos vivos e nunca usados, pois destruir
+# canais herdados aciona o core do gRPC com o estado do pai (aborta o processo)
+_inherited_pools = []
+
+def _reset_after_fork(client_ref):
+    client = client_ref()
+    if client is not None:
+        client._reset_after_fork()
+
+def _flush_token_store(client_ref):
+    # Na saída do processo: grava o que a thread do token store ainda não gravou
+    client = client_ref()
+    if client is not None:
+        client._flush_tokens()
+
+@functools.lru_cache(maxsize=8)
+def _decode_jwt_account_id(token):
+    """Extrai o account ID do payload do JWT ('sub', 'nameid' ou 'account_id').
+    Cacheado por token: relogins/refreshes que devolvem o mesmo JWT não decodificam de novo."""
+    try:
+        # JWT format: header.payload.signature (partition não cria a lista do split)
+        _, sep, rest = token.partition('.')
+        payload, sep2, signature = rest.partition('.')
+        if not (sep and sep2) or '.' in signature:
+            return None
+        # Add padding for base64 decoding
+        payload += '=' * (-len(payload) % 4)
+        payload_data = json.loads(base64.urlsafe_b64decode(payload))
+        account_id = payload_data.get('sub') or payload_data.get('nameid') or payload_data.get('account_id')
+        if account_id:
+            logger.debug("🔑 Account ID header: %s", account_id)
+        else:
+            logger.warning("⚠️ No account ID found in JWT payload")
+        return account_id
+    except Exception as e:
+        logger.warning("⚠️ Failed to extract account ID from JWT: %s", e)
+        return None
+
+def _default_server_address():
+    # Use environment variable or default port
+    port = os.getenv('GRPC_PORT', '5008')
+    return f'localhost:{port}'
+
 class GrpcClient:
     def __init__(self, server_address=None):
-        # Use environment variable or default port
         if server_address is None:
-            port = os.getenv('GRPC_PORT', '5008')
-            server_address = f'localhost:{port}'
+            server_address = _default_server_address()
         
         self.server_address = server_address
-        self.channel = None
-        self.auth_stub = None
-        self.player_stub = None
-        self._lock = threading.Lock()
+        self._pool = None
+        # Fecha os canais do pool quando o cliente é coletado ou o processo termina
+        self._pool_finalizer = None
+        # Reentrante: _save_tokens é chamado com o lock já adquirido durante o refresh
+        self._lock = threading.RLock()
+        # Lock próprio da criação do canal (independente do lock dos tokens)
+        self._connection_lock = threading.Lock()
+        # Processo filho de fork() não pode reutilizar o estado HTTP/2 herdado do pai
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=functools.partial(_reset_after_fork, weakref.ref(self)))
         
         # Tokens
-        self._jwt_token = None
-        self._jwt_expires_at = 0
+        self.set_token(None)
+        self._set_jwt_expiry(0)
         self._refresh_token = None
         self._refresh_expires_at = 0
+        self._refresh_timer = None
+        # Tokens gravados por último no disco (evita reescrever o arquivo sem mudança)
+        self._saved_tokens = None
+        # Gravação do token store fora da thread da RPC: só o último estado pendente é
+        # gravado (rajadas de refresh viram uma escrita); _store_lock serializa com a remoção
+        self._pending_store = None
+        self._store_lock = threading.Lock()
+        self._store_event = threading.Event()
+        self._store_thread = None
+        atexit.register(_flush_token_store, weakref.ref(self))
 
         self._load_tokens()
+        self._schedule_refresh()
+        # Autenticação centralizada: todo canal criado pelo cliente passa por aqui
+        self.auth_interceptor = AuthInterceptor(self.authenticated_metadata, self._refresh_rejected_jwt)
         # Mapa opcional WorldEntityId -> ItemId (preenchido externamente)
-        self._world_entity_item_map = {}
+        self._world_entity_item_map = _IdMap()
+        # Último GetWorldState recebido: (instante monotônico, resposta)
+        self._world_state_cache = (0.0, None)
+        # Último snapshot recebido pelo StreamWorldState (None = stream indisponível)
+        self._latest_world_state = None
+        self._world_state_thread = None
+        self._world_state_call = None
+        self._world_state_stop = threading.Event()
+        # Servidores antigos não têm o stream: nesse caso fica só o polling unário
+        self._world_state_stream_supported = True
+        # Atualizações de posição/stats seguem por um único PerformActionStream
+        self._action_queue = queue.SimpleQueue()
+        self._action_thread = None
+        self._action_stop = threading.Event()
+        self._action_stream_supported = True
+
+        # Aquece DNS/TCP/HTTP2 em segundo plano para a primeira RPC não pagar o handshake
+        self._ensure_connection()
 
     @property
     def jwt_token(self):
@@ -43,45 +305,118 @@ class GrpcClient:
     
     @jwt_token.setter
     def jwt_token(self, value):
-        self._jwt_token = value
+        self.set_token(value)
+
+    def _set_jwt_expiry(self, expires_at):
+        """Registra a expiração do JWT e o instante até o qual ele é considerado válido."""
+        self._jwt_expires_at = expires_at
+        self._valid_until = expires_at - 10
+
+    def set_token(self, token):
+        """Define o JWT da sessão e pré-monta os headers de autenticação (uma vez por token)."""
+        self._jwt_token = token
+        # Par (token, metadata) numa única atribuição: leitores nunca veem metade de cada token
+        self._auth_meta = (token, self._build_auth_metadata(token) if token else ())
+
+    @classmethod
+    def _build_auth_metadata(cls, token):
+        metadata = (('authorization', 'Bearer ' + token),)
+        if not SEND_ACCOUNT_ID_HEADER:
+            return metadata
+        account_id = _decode_jwt_account_id(token)
+        return (*metadata, ('x-account-id', account_id)) if account_id else metadata
 
     def _save_tokens(self):
+        """Agenda a gravação dos tokens atuais; a escrita acontece na thread do token store."""
         with self._lock:
+            state = (self._jwt_token, self._jwt_expires_at, self._refresh_token, self._refresh_expires_at)
+            if state == self._saved_tokens:
+                return
+            self._saved_tokens = state
+            self._pending_store = {
+                'jwt_token': self._jwt_token,
+                'jwt_expires_at': self._jwt_expires_at,
+                'refresh_token': self._refresh_token,
+                'refresh_expires_at': self._refresh_expires_at,
+                'server': self.server_address
+            }
+            thread = self._store_thread
+            if thread is None or not thread.is_alive():
+                self._store_thread = threading.Thread(target=self._token_store_worker, daemon=True)
+                self._store_thread.start()
+        self._store_event.set()
+
+    def _token_store_worker(self):
+        while True:
+            self._store_event.wait()
+            self._store_event.clear()
+            self._flush_tokens()
+
+    def _flush_tokens(self):
+        """Grava o estado pendente (se houver). Também chamado no atexit."""
+        with self._store_lock:
+            data, self._pending_store = self._pending_store, None
+            if data is None:
+                return
             try:
-                data = {
-                    'jwt_token': self._jwt_token,
-                    'jwt_expires_at': self._jwt_expires_at,
-                    'refresh_token': self._refresh_token,
-                    'refresh_expires_at': self._refresh_expires_at,
-                    'server': self.server_address
-                }
-                TOKEN_STORE_PATH.write_text(json.dumps(data))
+                if msgpack is not None:
+                    payload = msgpack.packb(data, use_bin_type=True)
+                else:
+                    payload = json.dumps(data).encode()
+                # Grava num arquivo temporário e troca atomicamente: um crash no meio
+                # nunca deixa o token store truncado
+                tmp = TOKEN_STORE_PATH.with_suffix('.tmp')
+                fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(payload)
+                    # Dados no disco antes da troca: sem isso um crash logo após o
+                    # os.replace pode deixar o arquivo novo vazio
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp, TOKEN_STORE_PATH)
             except Exception:
-                pass
+                # Próximo _save_tokens tenta de novo mesmo sem mudança nos tokens
+                self._saved_tokens = None
 
     def _load_tokens(self):
         with self._lock:
             try:
                 if TOKEN_STORE_PATH.exists():
-                    data = json.loads(TOKEN_STORE_PATH.read_text())
+                    raw = TOKEN_STORE_PATH.read_bytes()
+                    # Arquivos antigos (ou gravados sem msgpack) ainda estão em JSON
+                    if raw[:1] == b'{':
+                        data = json.loads(raw)
+                    else:
+                        data = msgpack.unpackb(raw, raw=False)
                     if data.get('server') == self.server_address:
-                        self._jwt_token = data.get('jwt_token')
-                        self._jwt_expires_at = data.get('jwt_expires_at', 0)
+                        self.set_token(data.get('jwt_token'))
+                        self._set_jwt_expiry(data.get('jwt_expires_at', 0))
                         self._refresh_token = data.get('refresh_token')
                         self._refresh_expires_at = data.get('refresh_expires_at', 0)
+                        self._saved_tokens = (self._jwt_token, self._jwt_expires_at,
+                                              self._refresh_token, self._refresh_expires_at)
             except Exception:
                 pass
 
     def _clear_tokens(self):
-        self._jwt_token = None
-        self._jwt_expires_at = 0
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
+        self.set_token(None)
+        self._set_jwt_expiry(0)
         self._refresh_token = None
         self._refresh_expires_at = 0
-        try:
-            if TOKEN_STORE_PATH.exists():
-                TOKEN_STORE_PATH.unlink()
-        except Exception:
-            pass
+        self._saved_tokens = None
+        _decode_jwt_account_id.cache_clear()
+        # Descarta gravação pendente; o lock garante que nenhuma escrita em curso
+        # recrie o arquivo depois da remoção
+        self._pending_store = None
+        with self._store_lock:
+            try:
+                if TOKEN_STORE_PATH.exists():
+                    TOKEN_STORE_PATH.unlink()
+            except Exception:
+                pass
 
     # --- Novos métodos de suporte a resolução WorldEntityId -> ItemId ---
     def register_world_entity_item(self, world_entity_id: str, item_id: str):
@@ -91,426 +426,552 @@ class GrpcClient:
 
     def bulk_register_world_entities(self, pairs):
         """Registra múltiplos pares (world_entity_id, item_id). pairs: Iterable[Tuple[str,str]]"""
-        for we_id, it_id in pairs:
-            if we_id and it_id:
-                self._world_entity_item_map[we_id] = it_id
+        self._world_entity_item_map.update((we_id, it_id) for we_id, it_id in pairs if we_id and it_id)
 
     def resolve_item_id(self, possible_id: str) -> str:
         """Se o ID for um WorldEntityId mapeado, retorna o ItemId correspondente; caso contrário retorna o próprio ID."""
-        return self._world_entity_item_map.get(possible_id, possible_id)
+        return self._world_entity_item_map[possible_id]
 
     def has_world_entity(self, world_entity_id: str) -> bool:
         return world_entity_id in self._world_entity_item_map
 
-    def _is_jwt_valid(self):
-        import time
-        has_token = bool(self._jwt_token)
-        time_valid = time.time() < (self._jwt_expires_at - 10)
-        result = has_token and time_valid
-        return result
+    def _is_jwt_valid(self, now=None):
+        # _valid_until já embute a margem de 10s (ver _set_jwt_expiry)
+        return bool(self._jwt_token) and (time.time() if now is None else now) < self._valid_until
+
+    def _refresh_jwt(self, now=None):
+        """Troca o refresh token por um novo JWT. Chamar com self._lock adquirido."""
+        if now is None:
+            now = time.time()
+        if not (self._refresh_token and now < (self._refresh_expires_at - 30)):
+            return False
+        try:
+            logger.info("🔄 Attempting token refresh...")
+            req = auth_pb2.RefreshTokenRequest(refresh_token=self._refresh_token)
+            resp = self.auth_stub.RefreshToken(req)
+            if resp.success:
+                logger.info("✅ Token refresh successful")
+                self.set_token(resp.jwt_token)
+                self._set_jwt_expiry(resp.expires_at)
+                self._refresh_token = resp.refresh_token
+                self._refresh_expires_at = resp.refresh_expires_at
+                self._save_tokens()
+                self._schedule_refresh()
+                return True
+            else:
+                logger.warning("❌ Token refresh failed: %s", resp.message)
+        except Exception as e:
+            logger.warning("❌ Token refresh error: %s", e)
+        return False
+
+    def _refresh_rejected_jwt(self, rejected_metadata):
+        """Chamado pelo AuthInterceptor quando o servidor recusa o JWT (UNAUTHENTICATED).
+        Retorna True se há um token novo para repetir a chamada."""
+        with self._lock:
+            metadata = self._auth_meta[1]
+            if metadata and metadata[0] not in rejected_metadata:
+                # Outra thread já renovou desde o envio
+                return True
+            return self._refresh_jwt()
+
+    def _schedule_refresh(self):
+        """Agenda a renovação do JWT em segundo plano pouco antes de ele expirar."""
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
+        if not self._refresh_token:
+            return
+        delay = max(0.0, self._jwt_expires_at - TOKEN_REFRESH_MARGIN - time.time())
+        timer = threading.Timer(delay, self._background_refresh)
+        timer.daemon = True
+        timer.start()
+        self._refresh_timer = timer
+
+    def _background_refresh(self):
+        with self._lock:
+            self._refresh_jwt()
 
     def _ensure_jwt(self):
+        # Caminho rápido sem lock: token válido é o caso comum em todo RPC
+        # Um único time.time() por chamada, repassado às checagens do caminho lento
+        now = time.time()
+        token = self._jwt_token
+        if token and now < self._valid_until:
+            return token
         with self._lock:
-            import time
-            if self._is_jwt_valid():
+            # Re-checa: outra thread pode ter renovado enquanto esperávamos o lock
+            if self._is_jwt_valid(now):
                 return self._jwt_token
-            if self._refresh_token and time.time() < (self._refresh_expires_at - 30):
-                # try refresh
-                try:
-                    print("🔄 Attempting token refresh...")
-                    req = auth_pb2.RefreshTokenRequest(refresh_token=self._refresh_token)
-                    resp = self.auth_stub.RefreshToken(req)
-                    if resp.success:
-                        print("✅ Token refresh successful")
-                        self._jwt_token = resp.jwt_token
-                        self._jwt_expires_at = resp.expires_at
-                        self._refresh_token = resp.refresh_token
-                        self._refresh_expires_at = resp.refresh_expires_at
-                        self._save_tokens()
-                        return self._jwt_token
-                    else:
-                        print(f"❌ Token refresh failed: {resp.message}")
-                except Exception as e:
-                    print(f"❌ Token refresh error: {e}")
-                    pass
-            print("❌ No valid JWT and cannot refresh; re-login required")
+            if self._refresh_jwt(now):
+                return self._jwt_token
+            logger.error("❌ No valid JWT and cannot refresh; re-login required")
             raise RuntimeError("No valid JWT and cannot refresh; re-login required")
 
+    # As propriedades abaixo criam o pool sob demanda: depois do aquecimento
+    # é só uma leitura de atributo, sem passar pelo lock de conexão
+    @property
+    def _connected_pool(self):
+        return self._pool or self._ensure_connection()
+
+    @property
+    def channel(self):
+        """Primeiro canal do pool (compatibilidade com código que usa um canal único)."""
+        return self._connected_pool.channels[0]
+
+    def connected_channels(self):
+        """Canais do pool atual, criando-o se preciso. A lista só é trocada quando o
+        pool é recriado (close()/fork): quem monta stubs próprios pode cacheá-los por ela."""
+        return self._connected_pool.channels
+
+    @property
+    def auth_stub(self):
+        return self._connected_pool.next_stubs()[0]
+
+    @property
+    def player_stub(self):
+        return self._connected_pool.next_stubs()[1]
+
     def _ensure_connection(self):
-        """Ensure we have an active gRPC connection"""
-        with self._lock:
-            if self.channel is None:
-                try:
-                    # Create channel with proper options for HTTP/2
-                    options = [
-                        ('grpc.keepalive_time_ms', 30000),
-                        ('grpc.keepalive_timeout_ms', 5000),
-                        ('grpc.keepalive_permit_without_calls', True),
-                        ('grpc.http2.max_pings_without_data', 0),
-                        ('grpc.http2.min_time_between_pings_ms', 10000),
-                        ('grpc.http2.min_ping_interval_without_data_ms', 300000)
-                    ]
-                    
-                    # Use insecure channel with HTTP/2 support
-                    self.channel = grpc.insecure_channel(self.server_address, options=options)
-                    
-                    # Test the connection
-                    grpc.channel_ready_future(self.channel).result(timeout=10)
-                    print("Successfully connected to gRPC server")
-                    
-                    # Initialize stubs
-                    self.auth_stub = auth_pb2_grpc.AuthServiceStub(self.channel)
-                    self.player_stub = player_pb2_grpc.PlayerServiceStub(self.channel)
-                    
-                except grpc.FutureTimeoutError:
-                    print("Timeout connecting to gRPC server")
-                    if self.channel:
-                        self.channel.close()
-                        self.channel = None
-                    raise ConnectionError("Failed to connect to gRPC server")
-                except Exception as e:
-                    print(f"Error connecting to gRPC server: {e}")
-                    if self.channel:
-                        self.channel.close()
-                        self.channel = None
-                    raise
+        """Ensure we have a gRPC channel pool (non-blocking; gRPC reconnects with backoff)
+        Retorna o pool atual."""
+        # Caminho rápido sem lock: o pool só é trocado por inteiro (None <-> pool pronto)
+        pool = self._pool
+        if pool is not None:
+            return pool
+        with self._connection_lock:
+            if self._pool is None:
+                # Insecure channels with HTTP/2 support; connect in the background
+                pool = _ChannelPool(self.server_address, CHANNEL_OPTIONS, self.auth_interceptor, CHANNEL_POOL_SIZE)
+                pool.ready_futures[0].add_done_callback(self._on_channel_ready)
+                self._pool = pool
+                self._pool_finalizer = weakref.finalize(self, pool.close)
+            return self._pool
+
+    def connect(self):
+        """Explicitly connect to the gRPC server
+        Idempotente: enquanto o cliente não for fechado, retorna sempre o mesmo pool."""
+        return self._ensure_connection()
+
+    def verify_keepalive(self, idle_seconds=None, timeout=CONNECT_TIMEOUT):
+        """Hook de teste: confirma que o canal segue pronto após ficar ocioso além do keepalive.
+        Lança grpc.FutureTimeoutError se a conexão não estiver pronta em alguma das checagens."""
+        channel = self.channel
+        grpc.channel_ready_future(channel).result(timeout=timeout)
+        time.sleep(idle_seconds if idle_seconds is not None else 2 * KEEPALIVE_MS / 1000)
+        grpc.channel_ready_future(channel).result(timeout=timeout)
+        return True
+
+    def is_connected(self):
+        """Checagem sem bloqueio: algum canal do pool está conectado agora. Permite à UI
+        avisar "conectando" em vez de travar o frame esperando a RPC."""
+        return self._connected_pool.is_ready()
+
+    def _reconnect_pool(self):
+        """Após UNAVAILABLE, reconecta todos os canais do pool de uma vez (o round-robin
+        tende a cair nos outros canais da mesma conexão perdida)."""
+        pool = self._pool
+        if pool is not None:
+            pool.reconnect()
+
+    @staticmethod
+    def _on_channel_ready(future):
+        if not future.cancelled():
+            logger.info("Successfully connected to gRPC server")
     
+    def _call(self, method, request, name, expect=True, **kwargs):
+        """Executa uma RPC unária com o tratamento de erro padrão do cliente.
+        expect=True repropaga o erro após registrá-lo; expect=False retorna None."""
+        try:
+            return method(request, **kwargs)
+        except grpc.RpcError as e:
+            logger.error("gRPC error in %s: %s - %s", name, e.code(), e.details())
+            if e.code() == grpc.StatusCode.UNAVAILABLE:
+                self._reconnect_pool()
+            if expect:
+                raise
+        except Exception as e:
+            logger.error("Error in %s: %s", name, e)
+            if expect:
+                raise
+        return None
+
     def login(self, email, password):
         """Login with email and password"""
-        try:
-            self._ensure_connection()
-            if self.auth_stub is None:
-                raise Exception("Auth service not available")
-                
-            request = auth_pb2.LoginRequest(email=email, password=password)
-            print(f"Sending login request for: {email}")
-            response = self.auth_stub.Login(request)
-            print("Login response received successfully")
-            # store tokens
-            if response.success:
-                import time
-                self._jwt_token = response.jwt_token
-                self._jwt_expires_at = response.expires_at
+        request = auth_pb2.LoginRequest(email=email, password=password)
+        logger.info("Sending login request for: %s", email)
+        response = self._call(self.auth_stub.Login, request, 'login',
+                              wait_for_ready=True, timeout=CONNECT_TIMEOUT)
+        logger.info("Login response received successfully")
+        self.store_login(response)
+        return response
+
+    def store_login(self, response):
+        """Guarda os tokens de um LoginResponse bem-sucedido e agenda o refresh."""
+        if response.success:
+            with self._lock:
+                self.set_token(response.jwt_token)
+                self._set_jwt_expiry(response.expires_at)
                 self._refresh_token = response.refresh_token
                 self._refresh_expires_at = response.refresh_expires_at
                 self._save_tokens()
-            return response
-        except grpc.RpcError as e:
-            print(f"gRPC error during login: {e.code()}: {e.details()}")
-            raise
-        except Exception as e:
-            print(f"Unexpected error during login: {e}")
-            raise
+                self._schedule_refresh()
     
     def create_account(self, email, password):
         """Create a new account"""
-        try:
-            self._ensure_connection()
-            if self.auth_stub is None:
-                raise Exception("Auth service not available")
-                
-            request = auth_pb2.CreateAccountRequest(email=email, password=password)
-            print(f"Sending create account request for: {email}")
-            response = self.auth_stub.CreateAccount(request)
-            print("Create account response received successfully")
-            return response
-        except grpc.RpcError as e:
-            print(f"gRPC error during account creation: {e.code()}: {e.details()}")
-            raise
-        except Exception as e:
-            print(f"Unexpected error during account creation: {e}")
-            raise
+        request = auth_pb2.CreateAccountRequest(email=email, password=password)
+        logger.info("Sending create account request for: %s", email)
+        response = self._call(self.auth_stub.CreateAccount, request, 'create_account',
+                              wait_for_ready=True, timeout=CONNECT_TIMEOUT)
+        logger.info("Create account response received successfully")
+        return response
     
+    def cached_auth_metadata(self):
+        """Header de autorização pré-montado se o JWT ainda é válido; None se precisaria de
+        refresh. Nunca faz I/O (seguro para chamar do event loop do cliente aio)."""
+        token, metadata = self._auth_meta
+        if token and token is self._jwt_token and time.time() < self._valid_until:
+            return metadata
+        return None
+
     def authenticated_metadata(self):
-        import base64
-        import json
-        
+        """Metadata de autenticação pré-montada em set_token (sem decodificar o JWT a cada RPC)."""
         token = self._ensure_jwt()
-        metadata = [('authorization', f'Bearer {token}')]
-        
-        # Extract account ID from JWT and add x-account-id header
-        try:
-            # JWT format: header.payload.signature
-            # We need to decode the payload to get the account ID
-            parts = token.split('.')
-            if len(parts) == 3:
-                # Decode the payload (add padding if needed)
-                payload = parts[1]
-                # Add padding for base64 decoding
-                payload += '=' * (4 - len(payload) % 4)
-                decoded_payload = base64.urlsafe_b64decode(payload)
-                payload_data = json.loads(decoded_payload)
-                
-                # Extract account ID (could be in 'sub', 'nameid', or 'account_id')
-                account_id = payload_data.get('sub') or payload_data.get('nameid') or payload_data.get('account_id')
-                if account_id:
-                    metadata.append(('x-account-id', account_id))
-                    print(f"🔑 Added account ID header: {account_id}")
-                else:
-                    print("⚠️ No account ID found in JWT payload")
-        except Exception as e:
-            print(f"⚠️ Failed to extract account ID from JWT: {e}")
-        
-        return metadata
+        cached_token, metadata = self._auth_meta
+        if cached_token is token:
+            return metadata
+        # Token trocado entre a validação e a leitura (refresh concorrente): monta para o validado
+        return self._build_auth_metadata(token)
 
     def get_players(self, token=None):
-        """Get list of characters for the authenticated user"""
-        try:
-            # Create the request
-            request = player_pb2.ListCharactersRequest()
-            
-            # Create metadata with authorization token
-            metadata = self.authenticated_metadata() if token is None else [('authorization', f'Bearer {token}')]
-            
-            # Make the gRPC call
-            response = self.player_stub.ListCharacters(request, metadata=metadata)
-            return response
-            
-        except grpc.RpcError as e:
-            print(f"gRPC error in get_players: {e.code()} - {e.details()}")
-            raise
-        except Exception as e:
-            print(f"Error in get_players: {e}")
-            raise
+        """Get list of characters for the authenticated user
+        Parâmetro token mantido apenas por compatibilidade (autenticação via AuthInterceptor)."""
+        return self._call(self.player_stub.ListCharacters, _LIST_CHARACTERS_REQUEST, 'get_players',
+                          wait_for_ready=True, timeout=SESSION_RPC_TIMEOUT)
     
     def create_character(self, token, name, vocation):
-        """Create a new character for the authenticated user"""
-        try:
-            # Create the request
-            request = player_pb2.CreateCharacterRequest()
-            request.name = name
-            request.vocation = vocation
-            
-            # Create metadata with authorization token
-            metadata = self.authenticated_metadata() if token is None else [('authorization', f'Bearer {token}')]
-            
-            # Make the gRPC call
-            response = self.player_stub.CreateCharacter(request, metadata=metadata)
-            return response
-            
-        except grpc.RpcError as e:
-            print(f"gRPC error in create_character: {e.code()} - {e.details()}")
-            raise
-        except Exception as e:
-            print(f"Error in create_character: {e}")
-            raise
+        """Create a new character for the authenticated user
+        Parâmetro token mantido apenas por compatibilidade (autenticação via AuthInterceptor)."""
+        request = player_pb2.CreateCharacterRequest(name=name, vocation=vocation)
+        return self._call(self.player_stub.CreateCharacter, request, 'create_character',
+                          wait_for_ready=True, timeout=SESSION_RPC_TIMEOUT)
     
     def join_world(self, token=None, player_id=None):
-        """Join the game world with a character"""
-        try:
-            self._ensure_connection()
-            
-            # Create request
-            request = player_pb2.JoinWorldRequest()
-            if player_id:
-                request.player_id = player_id
-            
-            # Add authorization header
-            metadata = self.authenticated_metadata() if token is None else [('authorization', f'Bearer {token}')]
-            
-            # Make the gRPC call
-            response = self.player_stub.JoinWorld(request, metadata=metadata)
-            return response
-            
-        except grpc.RpcError as e:
-            print(f"gRPC error in join_world: {e.code()} - {e.details()}")
-            raise
-        except Exception as e:
-            print(f"Error in join_world: {e}")
-            raise
+        """Join the game world with a character
+        Parâmetro token mantido apenas por compatibilidade (autenticação via AuthInterceptor)."""
+        request = player_pb2.JoinWorldRequest()
+        if player_id:
+            request.player_id = player_id
+        return self._call(self.player_stub.JoinWorld, request, 'join_world',
+                          wait_for_ready=True, timeout=SESSION_RPC_TIMEOUT)
     
     def leave_world(self, token=None):
-        """Leave the game world"""
-        try:
-            self._ensure_connection()
-            
-            # Create request
-            request = player_pb2.LeaveWorldRequest()
-            
-            # Add authorization header
-            metadata = self.authenticated_metadata() if token is None else [('authorization', f'Bearer {token}')]
-            
-            # Make the gRPC call
-            response = self.player_stub.LeaveWorld(request, metadata=metadata)
-            return response
-            
-        except grpc.RpcError as e:
-            print(f"gRPC error in leave_world: {e.code()} - {e.details()}")
-            raise
-        except Exception as e:
-            print(f"Error in leave_world: {e}")
-            raise
+        """Leave the game world
+        Parâmetro token mantido apenas por compatibilidade (autenticação via AuthInterceptor)."""
+        self.stop_world_state_stream()
+        # O stream de ações fica preso ao personagem; o próximo join abre outro
+        self.stop_action_stream()
+        return self._call(self.player_stub.LeaveWorld, _LEAVE_WORLD_REQUEST, 'leave_world',
+                          wait_for_ready=True, timeout=SESSION_RPC_TIMEOUT)
     
     def move_player(self, token, target_x, target_y, movement_type="walk"):
-        """Move player to a target position"""
-        try:
-            self._ensure_connection()
-            
-            # Create request
-            request = player_pb2.PlayerMoveRequest(
-                target_x=float(target_x),
-                target_y=float(target_y),
-                movement_type=movement_type
-            )
-            
-            # Add authorization header
-            metadata = self.authenticated_metadata() if token is None else [('authorization', f'Bearer {token}')]
-            
-            # Make the gRPC call
-            response = self.player_stub.MovePlayer(request, metadata=metadata)
-            return response
-            
-        except grpc.RpcError as e:
-            print(f"gRPC error in move_player: {e.code()} - {e.details()}")
-            raise
-        except Exception as e:
-            print(f"Error in move_player: {e}")
-            raise
+        """Move player to a target position
+        Parâmetro token mantido apenas por compatibilidade (autenticação via AuthInterceptor)."""
+        # Reuse the per-thread request prototype
+        request = _reusable_request('move_req', player_pb2.PlayerMoveRequest)
+        request.target_x = float(target_x)
+        request.target_y = float(target_y)
+        request.movement_type = movement_type
+        
+        return self._call(self._connected_pool.next_move_player(), request, 'move_player')
     
+    @staticmethod
+    def fill_stats(request, level, experience, hp, mp):
+        """Preenche o payload stats de um PlayerActionRequest (também usado pelo cliente aio)."""
+        stats = request.stats
+        stats.Clear()
+        stats.SetInParent()
+        
+        # Typed payload: only the provided fields are sent
+        if level is not None:
+            stats.level = int(level)
+        if experience is not None:
+            stats.experience = int(experience)
+        if hp is not None:
+            stats.hp = int(hp)
+        if mp is not None:
+            stats.mp = int(mp)
+        return request
+
+    @staticmethod
+    def fill_position(request, position_x, position_y, facing_direction, movement_state):
+        """Preenche o payload position de um PlayerActionRequest (também usado pelo cliente aio)."""
+        position = request.position
+        position.Clear()
+        position.SetInParent()
+        
+        # Typed payload: only the provided fields are sent
+        if position_x is not None:
+            position.position_x = position_x
+        if position_y is not None:
+            position.position_y = position_y
+        if facing_direction is not None:
+            position.facing_direction = int(facing_direction)
+        if movement_state is not None:
+            position.movement_state = str(movement_state)
+        return request
+
     def update_player_stats(self, token, level=None, experience=None, hp=None, mp=None):
-        """Update player stats on server (using PerformAction as a workaround)"""
-        try:
-            if not self.channel:
-                self.connect()
-            
-            # For now, we'll use PerformAction to simulate stat updates
-            # In a real implementation, you'd add a specific UpdatePlayerStats RPC
-            request = player_pb2.PlayerActionRequest()
-            request.action_type = "update_player_stats"
-            
-            # Use parameters to send the stats
-            if level is not None:
-                request.parameters["level"] = str(level)
-            if experience is not None:
-                request.parameters["experience"] = str(experience)
-            if hp is not None:
-                request.parameters["hp"] = str(hp)
-            if mp is not None:
-                request.parameters["mp"] = str(mp)
-            
-            # Add auth header
-            metadata = [('authorization', f'Bearer {token}')]
-            
-            response = self.player_stub.PerformAction(request, metadata=metadata)
-            if response and response.success:
-                print(f"✅ Stats update sent to server: level={level}, exp={experience}")
-            else:
-                print(f"❌ Stats update failed: {response.message if response else 'No response'}")
-            return response
-            
-        except grpc.RpcError as e:
-            print(f"gRPC error in update_player_stats: {e.code()} - {e.details()}")
-            return None
-        except Exception as e:
-            print(f"Error in update_player_stats: {e}")
-            return None
-    
+        """Enfileira a atualização de stats no PerformActionStream e retorna na hora.
+        Parâmetro token mantido apenas por compatibilidade (autenticação via AuthInterceptor)."""
+        # Mensagem nova a cada chamada (fica na fila); action_type por atribuição é mais barato
+        # que o construtor com kwargs ou CopyFrom de um template
+        request = _PlayerActionRequest()
+        request.action_type = "update_player_stats"
+        return self._queue_action(self.fill_stats(request, level, experience, hp, mp), 'update_player_stats')
+
     def update_player_position(self, token, position_x=None, position_y=None, facing_direction=None, movement_state=None):
-        """Update player position and state on server (using PerformAction)"""
-        try:
-            if not self.channel:
-                self.connect()
-            
-            # Use PerformAction to update position and state
-            request = player_pb2.PlayerActionRequest()
-            request.action_type = "update_position"
-            
-            # Use parameters to send the position data
-            if position_x is not None:
-                request.parameters["position_x"] = str(position_x)
-            if position_y is not None:
-                request.parameters["position_y"] = str(position_y)
-            if facing_direction is not None:
-                request.parameters["facing_direction"] = str(facing_direction)
-            if movement_state is not None:
-                request.parameters["movement_state"] = str(movement_state)
-            
-            # Add auth header
-            metadata = [('authorization', f'Bearer {token}')]
-            
-            response = self.player_stub.PerformAction(request, metadata=metadata)
-            if response and response.success:
-                print(f"✅ Position update sent to server: pos=({position_x},{position_y}), facing={facing_direction}, state={movement_state}")
-            else:
-                print(f"❌ Position update failed: {response.message if response else 'No response'}")
-            return response
-            
-        except grpc.RpcError as e:
-            print(f"gRPC error in update_player_position: {e.code()} - {e.details()}")
-            return None
-        except Exception as e:
-            print(f"Error in update_player_position: {e}")
-            return None
+        """Enfileira a atualização de posição/estado no PerformActionStream e retorna na hora.
+        Parâmetro token mantido apenas por compatibilidade (autenticação via AuthInterceptor)."""
+        request = _PlayerActionRequest()
+        request.action_type = "update_position"
+        return self._queue_action(
+            self.fill_position(request, position_x, position_y, facing_direction, movement_state),
+            'update_player_position')
+
+    def update_player_stats_unary(self, token, level=None, experience=None, hp=None, mp=None):
+        """Update player stats on server (using PerformAction as a workaround)
+        RPC unária com resposta do servidor, para usos pontuais.
+        Parâmetro token mantido apenas por compatibilidade (autenticação via AuthInterceptor)."""
+        # For now, we'll use PerformAction to simulate stat updates
+        # In a real implementation, you'd add a specific UpdatePlayerStats RPC
+        request = self.fill_stats(_reusable_request(
+            'stats_req', lambda: player_pb2.PlayerActionRequest(action_type="update_player_stats")),
+            level, experience, hp, mp)
+        
+        response = self._call(self._connected_pool.next_perform_action(), request, 'update_player_stats', expect=False)
+        if response and response.success:
+            logger.debug("✅ Stats update sent to server: level=%s, exp=%s", level, experience)
+        else:
+            logger.warning("❌ Stats update failed: %s", response.message if response else 'No response')
+        return response
+    
+    def update_player_position_unary(self, token, position_x=None, position_y=None, facing_direction=None, movement_state=None):
+        """Update player position and state on server (using PerformAction)
+        RPC unária com resposta do servidor, para usos pontuais.
+        Parâmetro token mantido apenas por compatibilidade (autenticação via AuthInterceptor)."""
+        # Use PerformAction to update position and state
+        request = self.fill_position(_reusable_request(
+            'pos_req', lambda: player_pb2.PlayerActionRequest(action_type="update_position")),
+            position_x, position_y, facing_direction, movement_state)
+        
+        response = self._call(self._connected_pool.next_perform_action(), request, 'update_player_position', expect=False)
+        if response and response.success:
+            logger.debug("✅ Position update sent to server: pos=(%s,%s), facing=%s, state=%s",
+                         position_x, position_y, facing_direction, movement_state)
+        else:
+            logger.warning("❌ Position update failed: %s", response.message if response else 'No response')
+        return response
+
+    def _queue_action(self, request, name):
+        """Envia a ação pelo PerformActionStream; sem suporte no servidor, usa a RPC unária."""
+        if not self._action_stream_supported:
+            return self._call(self._connected_pool.next_perform_action(), request, name, expect=False)
+        thread = self._action_thread
+        if thread is None or not thread.is_alive():
+            self._action_stop.clear()
+            self._action_thread = threading.Thread(target=self._action_stream_worker, daemon=True)
+            self._action_thread.start()
+        self._action_queue.put(request)
+        return _ACTION_QUEUED
+
+    def stop_action_stream(self, timeout=None):
+        """Fecha o PerformActionStream depois de enviar o que já está na fila.
+        Com timeout, espera o envio terminar (usado antes de fechar os canais)."""
+        thread = self._action_thread
+        if thread is not None and thread.is_alive():
+            self._action_stop.set()
+            self._action_queue.put(None)
+            if timeout is not None:
+                thread.join(timeout)
+
+    def _action_stream_worker(self):
+        delay = 0.5
+        # Última ação de cada payload enviada na tentativa atual. Posição e stats são
+        # valores absolutos, então reenviá-las após uma queda do stream é seguro.
+        last_sent = {}
+        while True:
+            pending = list(last_sent.values())
+
+            def requests(pending):
+                for request in itertools.chain(pending, self._coalesced_actions()):
+                    last_sent[request.WhichOneof('payload')] = request
+                    yield request
+
+            try:
+                response = self.player_stub.PerformActionStream(requests(pending))
+                logger.info("📤 Action stream closed: %s", response.message)
+                return
+            except grpc.RpcError as e:
+                if e.code() == grpc.StatusCode.UNIMPLEMENTED:
+                    logger.warning("⚠️ Server has no PerformActionStream; falling back to unary PerformAction")
+                    self._action_stream_supported = False
+                    for request in last_sent.values():
+                        self._call(self.player_stub.PerformAction, request, 'perform_action', expect=False)
+                    self._drain_action_queue()
+                    return
+                logger.error("gRPC error in action stream: %s - %s", e.code(), e.details())
+                if e.code() == grpc.StatusCode.UNAVAILABLE:
+                    self._reconnect_pool()
+            except Exception as e:
+                logger.error("Error in action stream: %s", e)
+            if self._action_stop.wait(delay):
+                return
+            delay = min(delay * 2, WORLD_STATE_STREAM_MAX_BACKOFF)
+
+    def _coalesced_actions(self):
+        """Itera a fila de ações até o sentinela None, fundindo atualizações consecutivas
+        do mesmo payload (campos ausentes não são alterados, então MergeFrom preserva o
+        efeito) e enviando no máximo uma a cada ACTION_SEND_INTERVAL."""
+        action_queue = self._action_queue
+        request = action_queue.get()
+        while request is not None:
+            kind = request.WhichOneof('payload')
+            following = _NOTHING_QUEUED
+            while kind is not None:
+                try:
+                    following = action_queue.get_nowait()
+                except queue.Empty:
+                    following = _NOTHING_QUEUED
+                    break
+                if following is None or following.WhichOneof('payload') != kind:
+                    break
+                request.MergeFrom(following)
+            yield request
+            if following is _NOTHING_QUEUED:
+                # Espera o intervalo (ou o stop) acumulando as próximas atualizações
+                self._action_stop.wait(ACTION_SEND_INTERVAL)
+                following = action_queue.get()
+            request = following
+
+    def _drain_action_queue(self):
+        while True:
+            try:
+                request = self._action_queue.get_nowait()
+            except queue.Empty:
+                return
+            if request is not None:
+                self._call(self.player_stub.PerformAction, request, 'perform_action', expect=False)
     
     def get_world_state(self, auth_token):
-        """Get current world state from server (polling-based)"""
-        try:
-            self._ensure_connection()
-            
-            # Prepare metadata with auth token
-            metadata = [('authorization', f'Bearer {auth_token}')]
-            
-            # Create request
-            request = player_pb2.GetWorldStateRequest()
-            
-            # Make the call
-            response = self.player_stub.GetWorldState(request, metadata=metadata)
-            
-            print(f"🌍 Received world state with {len(response.players)} players")
-            return response
-                
-        except grpc.RpcError as e:
-            print(f"gRPC error in get_world_state: {e.code()} - {e.details()}")
-            return None
-        except Exception as e:
-            print(f"Error in get_world_state: {e}")
-            return None
+        """Get current world state
+        Lê o último snapshot do StreamWorldState (sem RPC); enquanto o stream não entrega
+        o primeiro snapshot, cai no GetWorldState unário.
+        Parâmetro auth_token mantido apenas por compatibilidade (autenticação via AuthInterceptor)."""
+        latest = self._latest_world_state
+        if latest is not None:
+            return latest
+        self._start_world_state_stream()
+        now = time.monotonic()
+        cached_at, cached = self._world_state_cache
+        if cached is not None and now - cached_at < WORLD_STATE_TTL:
+            return cached
+        response = self._call(self._connected_pool.next_get_world_state(), _GET_WORLD_STATE_REQUEST, 'get_world_state', expect=False)
+        if response is not None:
+            self._world_state_cache = (now, response)
+            logger.debug("🌍 Received world state with %d players", len(response.players))
+        return response
 
-    def get_world_updates(self, auth_token):
-        """Get streaming world updates from server"""
-        try:
-            self._ensure_connection()
-            
-            # Prepare metadata with auth token
-            metadata = [('authorization', f'Bearer {auth_token}')]
-            
-            # Create request
-            request = player_pb2.WorldUpdateRequest()
-            
-            # Get streaming response
-            response_iterator = self.player_stub.GetWorldUpdates(request, metadata=metadata)
-            
-            print("🌍 Started receiving world updates stream")
-            
-            # Yield each update
-            for response in response_iterator:
-                yield response
-                
-        except grpc.RpcError as e:
-            print(f"gRPC error in get_world_updates: {e.code()} - {e.details()}")
+    def _start_world_state_stream(self):
+        if not self._world_state_stream_supported:
             return
-        except Exception as e:
-            print(f"Error in get_world_updates: {e}")
+        thread = self._world_state_thread
+        if thread is not None and thread.is_alive():
             return
-    
+        self._world_state_stop.clear()
+        self._world_state_thread = threading.Thread(target=self._world_state_stream_worker, daemon=True)
+        self._world_state_thread.start()
+
+    def stop_world_state_stream(self):
+        """Encerra o StreamWorldState (ao sair do mundo / fechar o cliente)."""
+        self._world_state_stop.set()
+        call = self._world_state_call
+        if call is not None:
+            call.cancel()
+        self._latest_world_state = None
+
+    def _world_state_stream_worker(self):
+        delay = 0.5
+        stop = self._world_state_stop
+        while not stop.is_set():
+            try:
+                call = self.player_stub.StreamWorldState(_GET_WORLD_STATE_REQUEST)
+                self._world_state_call = call
+                if stop.is_set():  # stop_world_state_stream chegou antes do call existir
+                    call.cancel()
+                logger.info("🌍 World state stream opened")
+                for response in call:
+                    self._latest_world_state = response
+                    delay = 0.5
+            except grpc.RpcError as e:
+                if e.code() == grpc.StatusCode.UNIMPLEMENTED:
+                    logger.warning("⚠️ Server has no StreamWorldState; falling back to GetWorldState polling")
+                    self._world_state_stream_supported = False
+                    return
+                if not stop.is_set():
+                    logger.error("gRPC error in world state stream: %s - %s", e.code(), e.details())
+                    if e.code() == grpc.StatusCode.UNAVAILABLE:
+                        self._reconnect_pool()
+            except Exception as e:
+                if not stop.is_set():
+                    logger.error("Error in world state stream: %s", e)
+            finally:
+                self._world_state_call = None
+                # Snapshot parado não deve ser servido como atual
+                self._latest_world_state = None
+            stop.wait(delay)
+            delay = min(delay * 2, WORLD_STATE_STREAM_MAX_BACKOFF)
+
     def close(self):
         """Close the gRPC connection"""
-        if self.channel:
-            self.channel.close()
-            self.channel = None
+        self.stop_world_state_stream()
+        self.stop_action_stream(timeout=CONNECT_TIMEOUT)
+        with self._connection_lock:
+            if self._pool:
+                self._pool_finalizer()  # fecha os canais (uma única vez)
+                self._pool = None
+                self._pool_finalizer = None
+        self._flush_tokens()
+
+    def _reset_after_fork(self):
+        """No processo filho: descarta canais, locks e timers herdados; a próxima RPC reconecta."""
+        if self._pool_finalizer is not None:
+            self._pool_finalizer.detach()
+        if self._pool is not None:
+            _inherited_pools.append(self._pool)
+        self._pool = None
+        self._pool_finalizer = None
+        self._lock = threading.RLock()
+        self._connection_lock = threading.Lock()
+        self._world_state_call = None
+        self._latest_world_state = None
+        self._refresh_timer = None
+        self._store_lock = threading.Lock()
+        self._store_event = threading.Event()
+        self._store_thread = None
+        self._schedule_refresh()
 
     def logout(self):
         try:
             if not self._jwt_token and not self._refresh_token:
                 self._clear_tokens()
                 return True
-            self._ensure_connection()
-            if self.auth_stub:
-                req = auth_pb2.LogoutRequest(jwt_token=self._jwt_token or '', refresh_token=self._refresh_token or '')
-                try:
-                    self.auth_stub.Logout(req, metadata=self.authenticated_metadata() if self._jwt_token else None)
-                except Exception:
-                    pass
+            self.stop_world_state_stream()
+            self.stop_action_stream()
+            req = auth_pb2.LogoutRequest(jwt_token=self._jwt_token or '', refresh_token=self._refresh_token or '')
+            try:
+                self.auth_stub.Logout(req, metadata=self.authenticated_metadata() if self._jwt_token else None)
+            except Exception:
+                pass
             self._clear_tokens()
             return True
         except Exception:
@@ -518,19 +979,16 @@ class GrpcClient:
     
     def resolve_world_entity_item(self, world_entity_id: str):
         """Chama RPC ResolveWorldEntityItem para obter ItemId a partir de WorldEntityId e registra no cache local."""
-        self._ensure_connection()
-        if self.player_stub is None:
-            raise Exception("Player service not available")
-        metadata = self.authenticated_metadata()
         req = player_pb2.ResolveWorldEntityItemRequest(world_entity_id=world_entity_id)
         try:
-            resp = self.player_stub.ResolveWorldEntityItem(req, metadata=metadata)
-            print(f"[ResolveWorldEntityItem] success={resp.success} message='{resp.message}' item_id={getattr(resp,'item_id',None)}")
+            resp = self.player_stub.ResolveWorldEntityItem(req)
+            logger.debug("[ResolveWorldEntityItem] success=%s message='%s' item_id=%s",
+                         resp.success, resp.message, getattr(resp, 'item_id', None))
             if resp.success and resp.item_id:
                 self.register_world_entity_item(world_entity_id, resp.item_id)
             return resp
         except grpc.RpcError as e:
-            print(f"[ResolveWorldEntityItem] gRPC ERROR code={e.code()} details={e.details()}")
+            logger.error("[ResolveWorldEntityItem] gRPC ERROR code=%s details=%s", e.code(), e.details())
             raise
 
     def pick_up_item(self, jwt_token, player_id, item_id=None, world_entity_id=None):
@@ -540,11 +998,6 @@ class GrpcClient:
           - world_entity_id (servidor resolve)
           - world_entity_id já mapeado (cache local converte para item_id)
         """
-        self._ensure_connection()
-        if self.player_stub is None:
-            raise Exception("Player service not available")
-        metadata = self.authenticated_metadata()
-
         resolved_item_id = None
         sending_world_entity_id = None
 
@@ -552,29 +1005,23 @@ class GrpcClient:
             # Pode ser um item direto ou um world entity id mapeado
             mapped = self.resolve_item_id(item_id)
             if mapped != item_id:
-                print(f"[PickUpItem] Translating WorldEntityId {item_id} -> ItemId {mapped}")
+                logger.debug("[PickUpItem] Translating WorldEntityId %s -> ItemId %s", item_id, mapped)
             resolved_item_id = mapped
         elif world_entity_id:
-            # Tentar cache
-            if self.has_world_entity(world_entity_id):
-                resolved_item_id = self.resolve_item_id(world_entity_id)
-                print(f"[PickUpItem] Cache map {world_entity_id} -> {resolved_item_id}")
+            # Tentar cache (uma única busca no mapa)
+            mapped = self._world_entity_item_map.get(world_entity_id)
+            if mapped is not None:
+                resolved_item_id = mapped
+                logger.debug("[PickUpItem] Cache map %s -> %s", world_entity_id, resolved_item_id)
             else:
                 # Enviar somente world_entity_id e deixar servidor resolver
                 sending_world_entity_id = world_entity_id
         else:
             raise ValueError("Forneça item_id ou world_entity_id")
 
-        try:
-            target = getattr(self.channel, 'target', None)
-            if callable(target):
-                target = target()
-            print(f"[PickUpItem] ChannelTarget={target}")
-        except Exception:
-            pass
-
-        print(f"[PickUpItem] player_id={player_id} item_id={resolved_item_id} world_entity_id={sending_world_entity_id}")
-        print(f"[PickUpItem] Metadata={metadata}")
+        # Sem logar o metadata: ele carrega o JWT completo
+        logger.debug("[PickUpItem] player_id=%s item_id=%s world_entity_id=%s",
+                     player_id, resolved_item_id, sending_world_entity_id)
 
         request_kwargs = { 'player_id': player_id }
         if resolved_item_id:
@@ -584,14 +1031,14 @@ class GrpcClient:
 
         request = player_pb2.PickUpItemRequest(**request_kwargs)
         try:
-            response = self.player_stub.PickUpItem(request, metadata=metadata)
-            print(f"[PickUpItem] Response success={response.success} message='{response.message}'")
+            response = self.player_stub.PickUpItem(request)
+            logger.debug("[PickUpItem] Response success=%s message='%s'", response.success, response.message)
             return response
         except grpc.RpcError as e:
-            print(f"[PickUpItem] gRPC ERROR code={e.code()} details={e.details()}")
+            logger.error("[PickUpItem] gRPC ERROR code=%s details=%s", e.code(), e.details())
             try:
                 dbg = e.debug_error_string()
-                print(f"[PickUpItem] debug_error_string={dbg}")
+                logger.debug("[PickUpItem] debug_error_string=%s", dbg)
             except Exception:
                 pass
             raise
@@ -602,5 +1049,21 @@ class GrpcClient:
             raise ValueError(f"WorldEntityId {world_entity_id} não está mapeado para um ItemId. Registre antes com register_world_entity_item().")
         return self.pick_up_item(jwt_token, player_id, world_entity_id)
 
-# Global instance (compatibilidade com telas que importam grpc_client)
-grpc_client = GrpcClient()
+@functools.lru_cache(maxsize=None)
+def _client_for(server_address):
+    if USE_AIO:
+        from .grpc_aio_client import AioGrpcClient
+        return AioGrpcClient(server_address)
+    return GrpcClient(server_address)
+
+def get_client(server_address=None):
+    """Retorna o GrpcClient compartilhado para o endereço, criado sob demanda."""
+    if server_address is None:
+        server_address = _default_server_address()
+    return _client_for(server_address)
+
+def __getattr__(name):
+    # Instância global sob demanda (compatibilidade com telas que importam grpc_client)
+    if name == 'grpc_client':
+        return get_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
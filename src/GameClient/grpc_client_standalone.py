@@ -1,5 +1,7 @@
 import grpc
+import logging
 import threading
+import functools
 import sys
 import os
 
@@ -11,6 +13,26 @@ sys.path.insert(0, generated_dir)
 import auth_pb2_grpc, auth_pb2
 import player_pb2_grpc, player_pb2
 
+# RPCs do loop de jogo (movimento/stats/posição) só logam em DEBUG
+logger = logging.getLogger(__name__)
+
+# Requests sem campos: uma instância compartilhada por tipo (não mutar)
+_LIST_CHARACTERS_REQUEST = player_pb2.ListCharactersRequest()
+_LEAVE_WORLD_REQUEST = player_pb2.LeaveWorldRequest()
+
+# Channel options for HTTP/2, montadas uma vez no módulo (reconexões não realocam)
+_CHANNEL_OPTIONS = (
+    ('grpc.keepalive_time_ms', 30000),
+    ('grpc.keepalive_timeout_ms', 5000),
+    ('grpc.keepalive_permit_without_calls', True),
+    ('grpc.http2.max_pings_without_data', 0),
+    ('grpc.http2.min_time_between_pings_ms', 10000),
+    # Alinhado ao keepalive_time: com 300000 os pings do canal ocioso
+    # (permit_without_calls) ficavam limitados a um a cada 5 min
+    ('grpc.http2.min_ping_interval_without_data_ms', 30000),
+    ('grpc.http2.bdp_probe', 1),
+)
+
 class GrpcClient:
     def __init__(self):
         self.server_address = 'localhost:5008'
@@ -18,46 +40,64 @@ class GrpcClient:
         self.auth_stub = None
         self.player_stub = None
         self._lock = threading.Lock()
+        # Header de autorização montado uma vez por token
+        self._auth_meta = (None, ())
+        # PlayerActionRequest reutilizado por thread nas atualizações de stats/posição
+        self._action_reqs = threading.local()
         
     def _ensure_connection(self):
         """Ensure we have an active gRPC connection"""
+        # Caminho rápido sem lock: canal já conectado
+        if self.channel is not None:
+            return
         with self._lock:
             if self.channel is None:
+                channel = None
                 try:
-                    # Create channel with proper options for HTTP/2
-                    options = [
-                        ('grpc.keepalive_time_ms', 30000),
-                        ('grpc.keepalive_timeout_ms', 5000),
-                        ('grpc.keepalive_permit_without_calls', True),
-                        ('grpc.http2.max_pings_without_data', 0),
-                        ('grpc.http2.min_time_between_pings_ms', 10000),
-                        ('grpc.http2.min_ping_interval_without_data_ms', 300000)
-                    ]
-                    
                     # Use insecure channel with HTTP/2 support
-                    self.channel = grpc.insecure_channel(self.server_address, options=options)
+                    channel = grpc.insecure_channel(self.server_address, options=_CHANNEL_OPTIONS)
                     
                     # Test the connection
-                    grpc.channel_ready_future(self.channel).result(timeout=10)
+                    grpc.channel_ready_future(channel).result(timeout=10)
                     print("Successfully connected to gRPC server")
                     
                     # Initialize stubs
-                    self.auth_stub = auth_pb2_grpc.AuthServiceStub(self.channel)
-                    self.player_stub = player_pb2_grpc.PlayerServiceStub(self.channel)
+                    self.auth_stub = auth_pb2_grpc.AuthServiceStub(channel)
+                    self.player_stub = player_pb2_grpc.PlayerServiceStub(channel)
+                    # RPCs do loop de jogo já ligadas (sem lookup no stub por chamada)
+                    self._move_player = self.player_stub.MovePlayer
+                    self._perform_action = self.player_stub.PerformAction
+                    # Publicado por último: o caminho rápido só vê canal pronto e com stubs
+                    self.channel = channel
                     
                 except grpc.FutureTimeoutError:
                     print("Timeout connecting to gRPC server")
-                    if self.channel:
-                        self.channel.close()
-                        self.channel = None
+                    channel.close()
                     raise ConnectionError("Failed to connect to gRPC server")
                 except Exception as e:
                     print(f"Error connecting to gRPC server: {e}")
-                    if self.channel:
-                        self.channel.close()
-                        self.channel = None
+                    if channel is not None:
+                        channel.close()
                     raise
     
+    def _auth_metadata(self, token):
+        """Retorna o header de autorização, reaproveitando a tupla enquanto o token não muda."""
+        cached_token, metadata = self._auth_meta
+        if cached_token is not token:
+            metadata = (('authorization', 'Bearer ' + token),)
+            self._auth_meta = (token, metadata)
+        return metadata
+
+    def _action_request(self, action_type):
+        """Retorna o PlayerActionRequest desta thread para action_type, com o payload limpo."""
+        request = getattr(self._action_reqs, action_type, None)
+        if request is None:
+            request = player_pb2.PlayerActionRequest(action_type=action_type)
+            setattr(self._action_reqs, action_type, request)
+        else:
+            request.ClearField('payload')
+        return request
+
     def connect(self):
         """Explicitly connect to the gRPC server"""
         self._ensure_connection()
@@ -66,9 +106,7 @@ class GrpcClient:
         """Register a new account"""
         try:
             self._ensure_connection()
-            request = auth_pb2.CreateAccountRequest()
-            request.email = email
-            request.password = password
+            request = auth_pb2.CreateAccountRequest(email=email, password=password)
             response = self.auth_stub.CreateAccount(request)
             print(f"Register response: success={response.success}, message={response.message}")
             return response
@@ -83,9 +121,7 @@ class GrpcClient:
         """Login to get access token"""
         try:
             self._ensure_connection()
-            request = auth_pb2.LoginRequest()
-            request.email = email
-            request.password = password
+            request = auth_pb2.LoginRequest(email=email, password=password)
             response = self.auth_stub.Login(request)
             print(f"Login response: success={response.success}, message={response.message}")
             return response
@@ -100,14 +136,9 @@ class GrpcClient:
         """Create a new character"""
         try:
             self._ensure_connection()
-            request = player_pb2.CreateCharacterRequest()
-            request.name = name
-            request.vocation = vocation
+            request = player_pb2.CreateCharacterRequest(name=name, vocation=vocation)
             
-            # Add auth header
-            metadata = [('authorization', f'Bearer {token}')]
-            
-            response = self.player_stub.CreateCharacter(request, metadata=metadata)
+            response = self.player_stub.CreateCharacter(request, metadata=self._auth_metadata(token))
             print(f"Create character response: success={response.success}, message={response.message}")
             return response
         except grpc.RpcError as e:
@@ -121,12 +152,7 @@ class GrpcClient:
         """List all characters for the account"""
         try:
             self._ensure_connection()
-            request = player_pb2.ListCharactersRequest()
-            
-            # Add auth header
-            metadata = [('authorization', f'Bearer {token}')]
-            
-            response = self.player_stub.ListCharacters(request, metadata=metadata)
+            response = self.player_stub.ListCharacters(_LIST_CHARACTERS_REQUEST, metadata=self._auth_metadata(token))
             print(f"List characters response: success={response.success}, found {len(response.characters)} characters")
             return response
         except grpc.RpcError as e:
@@ -142,10 +168,7 @@ class GrpcClient:
             self._ensure_connection()
             request = player_pb2.JoinWorldRequest()
             
-            # Add auth header
-            metadata = [('authorization', f'Bearer {token}')]
-            
-            response = self.player_stub.JoinWorld(request, metadata=metadata)
+            response = self.player_stub.JoinWorld(request, metadata=self._auth_metadata(token))
             print(f"Join world response: success={response.success}, message={response.message}")
             return response
         except grpc.RpcError as e:
@@ -159,12 +182,7 @@ class GrpcClient:
         """Leave the game world"""
         try:
             self._ensure_connection()
-            request = player_pb2.LeaveWorldRequest()
-            
-            # Add auth header
-            metadata = [('authorization', f'Bearer {token}')]
-            
-            response = self.player_stub.LeaveWorld(request, metadata=metadata)
+            response = self.player_stub.LeaveWorld(_LEAVE_WORLD_REQUEST, metadata=self._auth_metadata(token))
             print(f"Leave world response: success={response.success}, message={response.message}")
             return response
         except grpc.RpcError as e:
@@ -178,16 +196,11 @@ class GrpcClient:
         """Move player to a target position"""
         try:
             self._ensure_connection()
-            request = player_pb2.PlayerMoveRequest()
-            request.target_x = target_x
-            request.target_y = target_y
-            request.movement_type = movement_type
+            request = player_pb2.PlayerMoveRequest(
+                target_x=target_x, target_y=target_y, movement_type=movement_type)
             
-            # Add auth header
-            metadata = [('authorization', f'Bearer {token}')]
-            
-            response = self.player_stub.MovePlayer(request, metadata=metadata)
-            print(f"Move player response: success={response.success}, message={response.message}")
+            response = self._move_player(request, metadata=self._auth_metadata(token))
+            logger.debug("Move player response: success=%s, message=%s", response.success, response.message)
             return response
         except grpc.RpcError as e:
             print(f"gRPC error in move_player: {e.code()} - {e.details()}")
@@ -203,24 +216,22 @@ class GrpcClient:
             
             # For now, we'll use PerformAction to simulate stat updates
             # In a real implementation, you'd add a specific UpdatePlayerStats RPC
-            request = player_pb2.PlayerActionRequest()
-            request.action_type = "update_stats"
+            request = self._action_request("update_player_stats")
             
-            # Use parameters to send the stats
+            # Payload tipado: só os campos informados são enviados (sem str/int)
+            stats = request.stats
+            stats.SetInParent()
             if level is not None:
-                request.parameters["level"] = str(level)
+                stats.level = int(level)
             if experience is not None:
-                request.parameters["experience"] = str(experience)
+                stats.experience = int(experience)
             if hp is not None:
-                request.parameters["hp"] = str(hp)
+                stats.hp = int(hp)
             if mp is not None:
-                request.parameters["mp"] = str(mp)
-            
-            # Add auth header
-            metadata = [('authorization', f'Bearer {token}')]
+                stats.mp = int(mp)
             
-            response = self.player_stub.PerformAction(request, metadata=metadata)
-            print(f"Stats update sent to server: level={level}, exp={experience}")
+            response = self._perform_action(request, metadata=self._auth_metadata(token))
+            logger.debug("Stats update sent to server: level=%s, exp=%s", level, experience)
             return response
             
         except grpc.RpcError as e:
@@ -236,24 +247,23 @@ class GrpcClient:
             self._ensure_connection()
             
             # Use PerformAction to update position and state
-            request = player_pb2.PlayerActionRequest()
-            request.action_type = "update_position"
+            request = self._action_request("update_position")
             
-            # Use parameters to send the position data
+            # Payload tipado: só os campos informados são enviados (sem str/float)
+            position = request.position
+            position.SetInParent()
             if position_x is not None:
-                request.parameters["position_x"] = str(position_x)
+                position.position_x = position_x
             if position_y is not None:
-                request.parameters["position_y"] = str(position_y)
+                position.position_y = position_y
             if facing_direction is not None:
-                request.parameters["facing_direction"] = str(facing_direction)
+                position.facing_direction = int(facing_direction)
             if movement_state is not None:
-                request.parameters["movement_state"] = str(movement_state)
+                position.movement_state = str(movement_state)
             
-            # Add auth header
-            metadata = [('authorization', f'Bearer {token}')]
-            
-            response = self.player_stub.PerformAction(request, metadata=metadata)
-            print(f"Position update sent to server: pos=({position_x},{position_y}), facing={facing_direction}, state={movement_state}")
+            response = self._perform_action(request, metadata=self._auth_metadata(token))
+            logger.debug("Position update sent to server: pos=(%s,%s), facing=%s, state=%s",
+                         position_x, position_y, facing_direction, movement_state)
             return response
             
         except grpc.RpcError as e:
@@ -269,5 +279,13 @@ class GrpcClient:
             self.channel.close()
             self.channel = None
 
-# Global instance
-grpc_client = GrpcClient()
+@functools.lru_cache(maxsize=None)
+def get_client():
+    """Retorna a instância compartilhada, criada sob demanda."""
+    return GrpcClient()
+
+def __getattr__(name):
+    # Instância global sob demanda
+    if name == 'grpc_client':
+        return get_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
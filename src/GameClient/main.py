@@ -1,6 +1,8 @@
 import pygame
+import logging
 import sys
 import os
+import inspect
 
 # Add the parent directory to the Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -10,6 +12,7 @@ from GameClient.auth.create_account_screen import CreateAccountScreen
 from GameClient.game.character_selection_screen import CharacterSelectionScreen
 from GameClient.game.create_character_screen import CreateCharacterScreen
 from GameClient.game.game_screen import GameScreen
+from GameClient.grpc_client import get_client
 
 class Game:
     def __init__(self):
@@ -30,6 +33,14 @@ class Game:
             "create_char": CreateCharacterScreen(self),
             "in_game": GameScreen(self)
         }
+        # update(dt) ou update() por estado, resolvido uma vez (inspect.signature é caro por frame);
+        # estados sem update ficam de fora
+        self._update_takes_dt = {
+            name: len(inspect.signature(state.update).parameters) > 0
+            for name, state in self.states.items() if hasattr(state, 'update')
+        }
+        # Estados com reset(), consultado a cada troca de estado
+        self._has_reset = {name: hasattr(state, 'reset') for name, state in self.states.items()}
 
     def run(self):
         while self.running:
@@ -43,10 +54,9 @@ class Game:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 # Call leave_world before quitting if player is in game
-                if self.current_state == "in_game" and hasattr(self, 'auth_token') and self.auth_token:
+                if self.current_state == "in_game" and self.auth_token:
                     try:
-                        from GameClient.grpc_client import grpc_client
-                        response = grpc_client.leave_world(self.auth_token)
+                        response = get_client().leave_world(self.auth_token)
                         if response.success:
                             print(f"🚪 Successfully left world: {response.message}")
                         else:
@@ -58,14 +68,13 @@ class Game:
             self.states[self.current_state].handle_events(event)
 
     def update(self, dt):
-        if hasattr(self.states[self.current_state], 'update'):
-            # Check if update method accepts dt parameter
-            import inspect
-            sig = inspect.signature(self.states[self.current_state].update)
-            if len(sig.parameters) > 0:
-                self.states[self.current_state].update(dt)
-            else:
-                self.states[self.current_state].update()
+        takes_dt = self._update_takes_dt.get(self.current_state)
+        if takes_dt is None:
+            return
+        if takes_dt:
+            self.states[self.current_state].update(dt)
+        else:
+            self.states[self.current_state].update()
 
     def draw(self):
         self.screen.fill((20, 20, 40))  # Dark blue background
@@ -77,10 +86,12 @@ class Game:
         if token:
             self.auth_token = token
         # Reset state if needed
-        if hasattr(self.states[self.current_state], 'reset'):
+        if self._has_reset[self.current_state]:
             self.states[self.current_state].reset()
 
 
 if __name__ == "__main__":
+    # Mensagens dos módulos do cliente (grpc_client etc.) no console, sem prefixo
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     game = Game()
     game.run()
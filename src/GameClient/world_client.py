@@ -1,55 +1,149 @@
 import grpc
 import time
 import random
+import threading
+import collections
+import functools
+import itertools
+# grpc_client primeiro: ele põe Generated no sys.path (os *_pb2_grpc importam os *_pb2 absolutos)
+from .grpc_client import get_client, CHANNEL_OPTIONS
 from .Generated import world_pb2, world_pb2_grpc
-from .grpc_client import grpc_client
+
+# Capacidade do buffer de updates; ao transbordar, os mais antigos são descartados
+# e world_updates_overflowed sinaliza ao consumidor que recarregue o snapshot
+WORLD_UPDATES_BUFFER = 256
+
+# Backoff base de reconexão do stream por nº de erros consecutivos (o último se repete)
+_BACKOFFS = (0.25, 0.5, 1.0, 2.0, 4.0, 5.0)
+_MAX_BACKOFF_INDEX = len(_BACKOFFS) - 1
+
+# Requests sem campos: uma instância compartilhada por tipo (não mutar)
+_GET_WORLD_ENTITIES_REQUEST = world_pb2.GetWorldEntitiesRequest()
+_WORLD_UPDATE_REQUEST = world_pb2.WorldUpdateRequest()
 
 class WorldClient:
     def __init__(self, server_address="localhost:5008"):
         self.server_address = server_address
         self.channel = None
         self.world_stub = None
+        # (canais, próximo stub): stubs do WorldService sobre os canais do pool do GrpcClient
+        self._pool_stubs = (None, None)
+        # Sinalizado pelo callback de conectividade enquanto o canal próprio está READY
+        self._ready_event = threading.Event()
+        self._raw_channel = None
+        
+        # Updates recebidos pela thread do stream, drenados pelo loop do jogo
+        self.world_updates = collections.deque(maxlen=WORLD_UPDATES_BUFFER)
+        self.world_updates_overflowed = False
+        self._world_updates_generation = 0
+        # Cache local id -> WorldEntity: semeado pelo snapshot e mantido pelos deltas do stream
+        self.entities = {}
+        self._entities_seeded = False
         
     def _ensure_connection(self):
-        """Ensure gRPC connection is established"""
+        """Ensure gRPC connection is established
+        Retorna o stub; as chamadas usam `self.world_stub or self._ensure_connection()`
+        para só entrar aqui enquanto não há canal."""
         if self.channel is None:
-            self.channel = grpc.insecure_channel(self.server_address)
+            # Conexão própria, fora do pool do GrpcClient: o stream de updates do mundo
+            # não disputa a conexão com as RPCs interativas (ver _unary_stub)
+            raw_channel = grpc.insecure_channel(self.server_address, options=CHANNEL_OPTIONS)
+            # Estado de conectividade por push (um callback por canal), sem futures por reconexão
+            raw_channel.subscribe(self._on_state_change, try_to_connect=True)
+            self._raw_channel = raw_channel
+            self.channel = grpc.intercept_channel(raw_channel, get_client().auth_interceptor)
             self.world_stub = world_pb2_grpc.WorldServiceStub(self.channel)
+        return self.world_stub
 
-    def _call_with_retry(self, func, request):
-        """Executa RPC com retry único em caso de UNAUTHENTICATED tentando refresh automático."""
-        metadata = grpc_client.authenticated_metadata()
-        try:
-            return func(request, metadata=metadata)
-        except grpc.RpcError as e:
-            if e.code() == grpc.StatusCode.UNAUTHENTICATED:
-                # Em vez de invalidar o token, vamos forçar uma nova validação
-                try:
-                    # Force a new token check without invalidating
-                    metadata = grpc_client.authenticated_metadata()
-                    return func(request, metadata=metadata)
-                except Exception:
-                    raise
-            raise
+    def _on_state_change(self, state):
+        if state is grpc.ChannelConnectivity.READY:
+            self._ready_event.set()
+        else:
+            self._ready_event.clear()
+
+    def _wait_reconnect(self, backoff):
+        """Espera o backoff antes de reabrir o stream; se o canal estava fora do ar,
+        retorna assim que o callback de conectividade sinalizar READY."""
+        if self._ready_event.is_set():
+            time.sleep(backoff)
+        else:
+            self._ready_event.wait(backoff)
+
+    def _unary_stub(self):
+        """Stub das RPCs unárias (interativas). No mesmo servidor do GrpcClient usa os
+        canais do pool dele em round-robin; o canal próprio fica só com o stream de updates."""
+        client = get_client()
+        if self.server_address != client.server_address:
+            return self.world_stub or self._ensure_connection()
+        channels = client.connected_channels()
+        stub_channels, next_stub = self._pool_stubs
+        if stub_channels is not channels:
+            # Pool novo (primeiro uso, close() ou fork): refaz os stubs
+            next_stub = itertools.cycle(
+                [world_pb2_grpc.WorldServiceStub(c) for c in channels]).__next__
+            self._pool_stubs = (channels, next_stub)
+        return next_stub()
 
     def get_world_entities(self, _legacy_token_unused=None):
         """Get all world entities (NPCs, monsters, items)
-        Parâmetro _legacy_token_unused mantido apenas por compatibilidade (ignorado)."""
-        self._ensure_connection()
-        request = world_pb2.GetWorldEntitiesRequest()
-        return self._call_with_retry(self.world_stub.GetWorldEntities, request)
+        Parâmetro _legacy_token_unused mantido apenas por compatibilidade (ignorado).
+        O snapshot também (re)semeia o cache self.entities."""
+        # Refresh + nova tentativa em UNAUTHENTICATED ficam a cargo do AuthInterceptor
+        response = self._unary_stub().GetWorldEntities(_GET_WORLD_ENTITIES_REQUEST)
+        entities = {}
+        for group in (response.npcs, response.monsters, response.items):
+            for entity in group:
+                entities[entity.id] = entity
+        self.entities = entities
+        self._entities_seeded = True
+        return response
+
+    def cached_world_entities(self):
+        """Snapshot montado a partir do cache local (sem RPC), no formato de get_world_entities.
+        Retorna None enquanto o cache não foi semeado por um snapshot do servidor."""
+        if not self._entities_seeded:
+            return None
+        response = world_pb2.GetWorldEntitiesResponse(timestamp=int(time.time() * 1000))
+        groups = {'npc': response.npcs, 'monster': response.monsters, 'item': response.items}
+        # tuple() copia os valores de uma vez, sem concorrer com a thread do stream
+        for entity in tuple(self.entities.values()):
+            group = groups.get(entity.entity_type)
+            if group is not None:
+                group.append(entity)
+        return response
+
+    def _apply_world_update(self, update):
+        """Aplica um delta do stream ao cache local de entidades."""
+        entities = self.entities
+        for entity in update.updated_entities:
+            entities[entity.id] = entity
+        for removed_id in update.removed_entity_ids:
+            entities.pop(removed_id, None)
 
     def interact_with_entity(self, entity_id, interaction_type, parameters=None):
         """Interact with a world entity (attack, talk, pickup, etc.)"""
-        self._ensure_connection()
+        stub = self._unary_stub()
         request = world_pb2.InteractWithEntityRequest(
             entity_id=entity_id,
-            interaction_type=interaction_type
+            interaction_type=interaction_type,
+            parameters={k: str(v) for k, v in parameters.items()} if parameters else None
         )
-        if parameters:
-            for k, v in parameters.items():
-                request.parameters[k] = str(v)
-        return self._call_with_retry(self.world_stub.InteractWithEntity, request)
+        return stub.InteractWithEntity(request)
+
+    def interact_with_entities(self, interactions):
+        """Várias interações num único BatchInteract (ex: ataque em área).
+        interactions: iterável de (entity_id, interaction_type, parameters|None).
+        Retorna os InteractWithEntityResponse na mesma ordem."""
+        stub = self._unary_stub()
+        request = world_pb2.BatchInteractRequest(interactions=[
+            world_pb2.InteractWithEntityRequest(
+                entity_id=entity_id,
+                interaction_type=interaction_type,
+                parameters={k: str(v) for k, v in parameters.items()} if parameters else None
+            )
+            for entity_id, interaction_type, parameters in interactions
+        ])
+        return stub.BatchInteract(request).results
 
     def get_world_updates_stream(self, max_total_retries=None, on_reconnect=None):
         """Stream resiliente com reconexão automática e refresh de token.
@@ -63,9 +157,7 @@ class WorldClient:
                 break
             attempt += 1
             try:
-                metadata = grpc_client.authenticated_metadata()
-                request = world_pb2.WorldUpdateRequest()
-                stream = self.world_stub.GetWorldUpdates(request, metadata=metadata)
+                stream = self.world_stub.GetWorldUpdates(_WORLD_UPDATE_REQUEST)
                 if on_reconnect and attempt > 1:
                     try:
                         on_reconnect({'type': 'reconnected', 'attempt': attempt})
@@ -79,7 +171,8 @@ class WorldClient:
                 time.sleep(0.2)
             except grpc.RpcError as e:
                 code = e.code()
-                consecutive_errors += 1
+                if consecutive_errors < _MAX_BACKOFF_INDEX:
+                    consecutive_errors += 1
                 # Tratamento específico
                 if code == grpc.StatusCode.UNAUTHENTICATED:
                     # forçar refresh e tentar novamente
@@ -88,7 +181,7 @@ class WorldClient:
                         except Exception: pass
                     try:
                         # Em vez de invalidar o token, apenas force nova autenticação
-                        grpc_client.authenticated_metadata()  # dispara refresh se necessário
+                        get_client().authenticated_metadata()  # dispara refresh se necessário
                         # backoff curto antes de nova tentativa
                         time.sleep(0.25)
                         continue
@@ -101,10 +194,8 @@ class WorldClient:
                     if on_reconnect:
                         try: on_reconnect({'type': 'transient_error', 'code': code.name, 'attempt': attempt})
                         except Exception: pass
-                    # Exponential backoff com jitter
-                    backoff = min(5.0, (2 ** min(consecutive_errors, 5)) * 0.25)
-                    backoff = backoff * (0.7 + random.random() * 0.6)
-                    time.sleep(backoff)
+                    # Backoff da tabela com jitter
+                    self._wait_reconnect(_BACKOFFS[consecutive_errors] * (0.7 + random.random() * 0.6))
                     continue
                 else:
                     if on_reconnect:
@@ -112,20 +203,58 @@ class WorldClient:
                         except Exception: pass
                     break
             except Exception:
-                consecutive_errors += 1
+                if consecutive_errors < _MAX_BACKOFF_INDEX:
+                    consecutive_errors += 1
                 if on_reconnect:
                     try: on_reconnect({'type': 'exception', 'attempt': attempt})
                     except Exception: pass
-                backoff = min(5.0, (2 ** min(consecutive_errors, 5)) * 0.25)
-                time.sleep(backoff)
+                time.sleep(_BACKOFFS[consecutive_errors])
                 continue
 
+    def start_world_updates(self):
+        """Consome get_world_updates_stream() em uma thread daemon, acumulando em self.world_updates."""
+        self._world_updates_generation += 1
+        threading.Thread(target=self._world_updates_worker,
+                         args=(self._world_updates_generation,), daemon=True).start()
+
+    def stop_world_updates(self):
+        """Encerra a thread do stream no próximo update recebido."""
+        self._world_updates_generation += 1
+
+    def _world_updates_worker(self, generation):
+        updates = self.world_updates
+        try:
+            for update in self.get_world_updates_stream():
+                # Check if we should still be running
+                if generation != self._world_updates_generation:
+                    break
+                # O cache recebe todos os deltas, mesmo os que o buffer vier a descartar
+                self._apply_world_update(update)
+                if len(updates) == updates.maxlen:
+                    self.world_updates_overflowed = True
+                updates.append(update)
+        except Exception as e:
+            print(f"❌ World entity updates stream error: {e}")
+        finally:
+            print("🌍 World entity updates stream ended")
+
     def close(self):
         """Close the gRPC channel"""
         if self.channel:
+            self._raw_channel.unsubscribe(self._on_state_change)
+            self._ready_event.clear()
             self.channel.close()
             self.channel = None
+            self._raw_channel = None
             self.world_stub = None
 
-# Global instance
-world_client = WorldClient()
+@functools.lru_cache(maxsize=None)
+def get_world_client():
+    """Retorna a instância compartilhada, criada sob demanda (o import não conecta)."""
+    return WorldClient()
+
+def __getattr__(name):
+    # Instância global sob demanda (compatibilidade com `from .world_client import world_client`)
+    if name == 'world_client':
+        return get_world_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -87,8 +87,7 @@ public class JwtAuthInterceptor : Interceptor
         }
 
         // Add custom headers with user info for the service to use
-        context.RequestHeaders.Add("x-account-id", accountId);
-        context.RequestHeaders.Add("x-account-email", email ?? "");
+        SetAccountHeaders(context, accountId, email);
 
         if (_logger.IsEnabled(LogLevel.Debug))
             _logger.LogDebug("Authenticated unary request account={AccountId} method={Method}", accountId, method);
@@ -101,6 +100,21 @@ public class JwtAuthInterceptor : Interceptor
         IServerStreamWriter<TResponse> responseStream,
         ServerCallContext context,
         ServerStreamingServerMethod<TRequest, TResponse> continuation)
+    {
+        await AuthenticateStreamAsync(context);
+        await continuation(request, responseStream, context);
+    }
+
+    public override async Task<TResponse> ClientStreamingServerHandler<TRequest, TResponse>(
+        IAsyncStreamReader<TRequest> requestStream,
+        ServerCallContext context,
+        ClientStreamingServerMethod<TRequest, TResponse> continuation)
+    {
+        await AuthenticateStreamAsync(context);
+        return await continuation(requestStream, context);
+    }
+
+    private async Task AuthenticateStreamAsync(ServerCallContext context)
     {
         var method = context.Method;
         if (_logger.IsEnabled(LogLevel.Debug))
@@ -110,7 +124,6 @@ public class JwtAuthInterceptor : Interceptor
         {
             if (_logger.IsEnabled(LogLevel.Trace))
                 _logger.LogTrace("Skipping auth (public) stream method={Method}", method);
-            await continuation(request, responseStream, context);
             return;
         }
 
@@ -159,12 +172,23 @@ public class JwtAuthInterceptor : Interceptor
         }
 
         // Add custom headers with user info for the service to use
-        context.RequestHeaders.Add("x-account-id", accountId);
-        context.RequestHeaders.Add("x-account-email", email ?? "");
+        SetAccountHeaders(context, accountId, email);
 
         if (_logger.IsEnabled(LogLevel.Debug))
             _logger.LogDebug("Authenticated streaming request account={AccountId} method={Method}", accountId, method);
+    }
 
-        await continuation(request, responseStream, context);
+    private static void SetAccountHeaders(ServerCallContext context, string accountId, string? email)
+    {
+        // A identidade vem só do JWT validado: descarta valores enviados pelo cliente,
+        // senão GetAccountId (FirstOrDefault) leria o header do cliente primeiro
+        var headers = context.RequestHeaders;
+        for (var i = headers.Count - 1; i >= 0; i--)
+        {
+            if (headers[i].Key == "x-account-id" || headers[i].Key == "x-account-email")
+                headers.RemoveAt(i);
+        }
+        headers.Add("x-account-id", accountId);
+        headers.Add("x-account-email", email ?? "");
     }
 }
@@ -45,6 +45,10 @@ builder.Services.AddGrpc(options =>
     options.Interceptors.Add<JwtAuthInterceptor>();
     options.MaxReceiveMessageSize = 4 * 1024 * 1024; // 4MB
     options.MaxSendMessageSize = 4 * 1024 * 1024; // 4MB
+    // Sem compressão por padrão: respostas pequenas (movimento/ações) ficariam mais caras.
+    // Snapshots/streams de entidades e ListCharacters ligam gzip por chamada (UseGzipResponse),
+    // pois comprimem bem; só vale quando o cliente anuncia gzip em grpc-accept-encoding
+    options.ResponseCompressionLevel = System.IO.Compression.CompressionLevel.Fastest;
 });
 
 // Add gRPC reflection for development
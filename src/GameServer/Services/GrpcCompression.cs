@@ -0,0 +1,13 @@
+using Grpc.Core;
+
+namespace GameServer.Services;
+
+public static class GrpcCompression
+{
+    // Liga gzip só na chamada atual (listas/snapshots grandes); as RPCs de
+    // movimento continuam sem compressão, onde o custo de CPU supera o ganho
+    public static void UseGzipResponse(this ServerCallContext context)
+    {
+        context.ResponseHeaders.Add("grpc-internal-encoding-request", "gzip");
+    }
+}
@@ -14,6 +14,8 @@ public class PlayerServiceImpl : GameServer.Protos.PlayerService.PlayerServiceBa
     private readonly IWorldManager _worldService;
     private readonly ConcurrentDictionary<string, IServerStreamWriter<WorldUpdateResponse>> _worldStreams = new();
     private readonly ItemService _itemService; // novo
+    // Intervalo de amostragem do StreamWorldState (mesma cadência do antigo polling do cliente)
+    private static readonly TimeSpan WorldStateStreamInterval = TimeSpan.FromMilliseconds(100);
 
     public PlayerServiceImpl(GameDbContext dbContext, ILogger<PlayerServiceImpl> logger, IWorldManager worldService, ItemService itemService)
     {
@@ -142,6 +144,8 @@ public class PlayerServiceImpl : GameServer.Protos.PlayerService.PlayerServiceBa
         try
         {
             var accountId = GetAccountId(context);
+            // Registros completos dos personagens (nomes, stats, posição): comprimem bem
+            context.UseGzipResponse();
 
             // Get all characters for this account
             var players = await _dbContext.Players
@@ -429,7 +433,11 @@ public class PlayerServiceImpl : GameServer.Protos.PlayerService.PlayerServiceBa
             return new PlayerMoveResponse
             {
                 Success = true,
-                Message = $"Moved to ({request.TargetX}, {request.TargetY})"
+                Message = $"Moved to ({request.TargetX}, {request.TargetY})",
+                PositionX = player.PositionX,
+                PositionY = player.PositionY,
+                FacingDirection = player.FacingDirection,
+                MovementState = player.MovementState
             };
         }
         catch (Exception ex)
@@ -461,15 +469,7 @@ public class PlayerServiceImpl : GameServer.Protos.PlayerService.PlayerServiceBa
                 };
             }
 
-            Guid? targetId = null;
-            if (!string.IsNullOrEmpty(request.TargetId) && Guid.TryParse(request.TargetId, out var parsedTargetId))
-            {
-                targetId = parsedTargetId;
-            }
-
-            var parameters = request.Parameters?.ToDictionary(kvp => kvp.Key, kvp => kvp.Value);
-
-            var success = await _worldService.PerformPlayerActionAsync(player.Id, request.ActionType, targetId, parameters);
+            var success = await ApplyActionAsync(player.Id, request);
 
             var response = new PlayerActionResponse
             {
@@ -500,6 +500,87 @@ public class PlayerServiceImpl : GameServer.Protos.PlayerService.PlayerServiceBa
         }
     }
 
+    public override async Task<PlayerActionResponse> PerformActionStream(IAsyncStreamReader<PlayerActionRequest> requestStream, ServerCallContext context)
+    {
+        try
+        {
+            var accountId = GetAccountId(context);
+
+            // O stream fica preso ao personagem online no momento em que foi aberto
+            var player = await _dbContext.Players
+                .AsNoTracking()
+                .FirstOrDefaultAsync(p => p.AccountId == accountId && p.IsOnline);
+
+            if (player == null)
+            {
+                return new PlayerActionResponse
+                {
+                    Success = false,
+                    Message = "Player not found or not online"
+                };
+            }
+
+            var applied = 0;
+            var failed = 0;
+            await foreach (var request in requestStream.ReadAllAsync(context.CancellationToken))
+            {
+                if (await ApplyActionAsync(player.Id, request))
+                    applied++;
+                else
+                    failed++;
+            }
+
+            _logger.LogInformation("📤 Action stream ended for player {PlayerId}: {Applied} applied, {Failed} failed", player.Id, applied, failed);
+            return new PlayerActionResponse
+            {
+                Success = failed == 0,
+                Message = $"{applied} actions applied, {failed} failed"
+            };
+        }
+        catch (RpcException)
+        {
+            throw;
+        }
+        catch (OperationCanceledException) when (context.CancellationToken.IsCancellationRequested)
+        {
+            throw new RpcException(new Status(StatusCode.Cancelled, "Action stream cancelled by client"));
+        }
+        catch (Exception ex)
+        {
+            _logger.LogError(ex, "Error in action stream");
+            throw new RpcException(new Status(StatusCode.Internal, "Internal server error"));
+        }
+    }
+
+    private async Task<bool> ApplyActionAsync(Guid playerId, PlayerActionRequest request)
+    {
+        switch (request.PayloadCase)
+        {
+            case PlayerActionRequest.PayloadOneofCase.Stats:
+                var stats = request.Stats;
+                return await _worldService.UpdatePlayerStatsAsync(playerId,
+                    stats.HasLevel ? stats.Level : null,
+                    stats.HasExperience ? stats.Experience : null,
+                    stats.HasHp ? stats.Hp : null,
+                    stats.HasMp ? stats.Mp : null);
+            case PlayerActionRequest.PayloadOneofCase.Position:
+                var position = request.Position;
+                return await _worldService.UpdatePlayerPositionAsync(playerId,
+                    position.HasPositionX ? position.PositionX : null,
+                    position.HasPositionY ? position.PositionY : null,
+                    position.HasFacingDirection ? position.FacingDirection : null,
+                    position.HasMovementState ? position.MovementState : null);
+            default:
+                Guid? targetId = null;
+                if (!string.IsNullOrEmpty(request.TargetId) && Guid.TryParse(request.TargetId, out var parsedTargetId))
+                {
+                    targetId = parsedTargetId;
+                }
+                var parameters = request.Parameters?.ToDictionary(kvp => kvp.Key, kvp => kvp.Value);
+                return await _worldService.PerformPlayerActionAsync(playerId, request.ActionType, targetId, parameters);
+        }
+    }
+
     public override async Task<GetWorldStateResponse> GetWorldState(GetWorldStateRequest request, ServerCallContext context)
     {
         var accountId = GetAccountId(context);
@@ -522,6 +603,42 @@ public class PlayerServiceImpl : GameServer.Protos.PlayerService.PlayerServiceBa
         return response;
     }
 
+    public override async Task StreamWorldState(GetWorldStateRequest request, IServerStreamWriter<GetWorldStateResponse> responseStream, ServerCallContext context)
+    {
+        var accountId = GetAccountId(context);
+        _logger.LogInformation("🌍 Starting world state stream for account {AccountId}", accountId);
+
+        GetWorldStateResponse? last = null;
+        try
+        {
+            while (!context.CancellationToken.IsCancellationRequested)
+            {
+                var onlinePlayers = await _worldService.GetOnlinePlayersAsync();
+                var response = new GetWorldStateResponse
+                {
+                    Timestamp = DateTimeOffset.UtcNow.ToUnixTimeMilliseconds()
+                };
+                foreach (var player in onlinePlayers)
+                {
+                    response.Players.Add(ConvertToPlayerInfo(player));
+                }
+
+                // Só envia quando algo mudou; a conexão ociosa é mantida pelos pings HTTP/2
+                if (last == null || !response.Players.Equals(last.Players))
+                {
+                    await responseStream.WriteAsync(response);
+                    last = response;
+                }
+
+                await Task.Delay(WorldStateStreamInterval, context.CancellationToken);
+            }
+        }
+        catch (OperationCanceledException) when (context.CancellationToken.IsCancellationRequested)
+        {
+            _logger.LogInformation("World state stream cancelled by client (account {AccountId})", accountId);
+        }
+    }
+
     public override async Task<PickUpItemResponse> PickUpItem(PickUpItemRequest request, ServerCallContext context)
     {
         try
@@ -11,6 +11,8 @@ public interface IWorldManager
     Task<bool> LeaveWorldAsync(Guid playerId);
     Task<bool> MovePlayerAsync(Guid playerId, float targetX, float targetY, string movementType);
     Task<bool> PerformPlayerActionAsync(Guid playerId, string actionType, Guid? targetId, Dictionary<string, string>? parameters);
+    Task<bool> UpdatePlayerStatsAsync(Guid playerId, int? level, int? experience, int? hp, int? mp);
+    Task<bool> UpdatePlayerPositionAsync(Guid playerId, float? positionX, float? positionY, int? facingDirection, string? movementState);
     Task<Player?> GetPlayerAsync(Guid playerId);
     Task<IEnumerable<Player>> GetOnlinePlayersAsync();
     Task<bool> IsPositionValidAsync(float x, float y);
@@ -353,36 +355,72 @@ public class WorldManager : IWorldManager
         return Task.FromResult(false);
     }
 
-    private async Task<bool> HandleUpdateStatsAction(Player player, Dictionary<string, string>? parameters)
+    public async Task<bool> UpdatePlayerStatsAsync(Guid playerId, int? level, int? experience, int? hp, int? mp)
     {
-        try
+        if (!_onlinePlayers.TryGetValue(playerId, out var player))
         {
-            if (parameters == null)
-                return false;
+            _logger.LogWarning("🚫 Player {PlayerId} not found in online players for stats update", playerId);
+            return false;
+        }
+
+        return await ApplyStatsUpdateAsync(player, level, experience, hp, mp);
+    }
+
+    public async Task<bool> UpdatePlayerPositionAsync(Guid playerId, float? positionX, float? positionY, int? facingDirection, string? movementState)
+    {
+        if (!_onlinePlayers.TryGetValue(playerId, out var player))
+        {
+            _logger.LogWarning("🚫 Player {PlayerId} not found in online players for position update", playerId);
+            return false;
+        }
+
+        return await ApplyPositionUpdateAsync(player, positionX, positionY, facingDirection, movementState);
+    }
+
+    private static int? ParseInt(Dictionary<string, string> parameters, string key) =>
+        parameters.TryGetValue(key, out var str) && int.TryParse(str, out var value) ? value : null;
+
+    private static float? ParseFloat(Dictionary<string, string> parameters, string key) =>
+        parameters.TryGetValue(key, out var str) && float.TryParse(str, out var value) ? value : null;
 
-            // Update player stats from parameters
-            if (parameters.TryGetValue("level", out var levelStr) && int.TryParse(levelStr, out var level))
+    private Task<bool> HandleUpdateStatsAction(Player player, Dictionary<string, string>? parameters)
+    {
+        if (parameters == null)
+            return Task.FromResult(false);
+
+        return ApplyStatsUpdateAsync(player,
+            ParseInt(parameters, "level"),
+            ParseInt(parameters, "experience"),
+            ParseInt(parameters, "hp"),
+            ParseInt(parameters, "mp"));
+    }
+
+    private async Task<bool> ApplyStatsUpdateAsync(Player player, int? level, int? experience, int? hp, int? mp)
+    {
+        try
+        {
+            if (level.HasValue)
             {
-                player.Level = level;
-                _logger.LogInformation("Updated player {PlayerName} level to {Level}", player.Name, level);
+                player.Level = level.Value;
+                _logger.LogInformation("Updated player {PlayerName} level to {Level}", player.Name, level.Value);
             }
 
-            if (parameters.TryGetValue("experience", out var expStr) && int.TryParse(expStr, out var experience))
+            if (experience.HasValue)
             {
-                player.Experience = experience;
-                _logger.LogInformation("Updated player {PlayerName} experience to {Experience}", player.Name, experience);
+                player.Experience = experience.Value;
+                _logger.LogInformation("Updated player {PlayerName} experience to {Experience}", player.Name, experience.Value);
             }
 
-            if (parameters.TryGetValue("hp", out var hpStr) && int.TryParse(hpStr, out var hp))
+            if (hp.HasValue)
             {
-                player.CurrentHp = hp;
-                _logger.LogInformation("Updated player {PlayerName} HP to {HP}", player.Name, hp);
+                player.CurrentHp = hp.Value;
+                _logger.LogInformation("Updated player {PlayerName} HP to {HP}", player.Name, hp.Value);
             }
 
-            if (parameters.TryGetValue("mp", out var mpStr) && int.TryParse(mpStr, out var mp))
+            if (mp.HasValue)
             {
-                player.CurrentMp = mp;
-                _logger.LogInformation("Updated player {PlayerName} MP to {MP}", player.Name, mp);
+                player.CurrentMp = mp.Value;
+                _logger.LogInformation("Updated player {PlayerName} MP to {MP}", player.Name, mp.Value);
             }
 
             // Save changes to database
@@ -410,36 +448,45 @@ public class WorldManager : IWorldManager
         }
     }
 
-    private async Task<bool> HandleUpdatePositionAction(Player player, Dictionary<string, string>? parameters)
+    private Task<bool> HandleUpdatePositionAction(Player player, Dictionary<string, string>? parameters)
+    {
+        if (parameters == null)
+            return Task.FromResult(false);
+
+        parameters.TryGetValue("movement_state", out var movementState);
+        return ApplyPositionUpdateAsync(player,
+            ParseFloat(parameters, "position_x"),
+            ParseFloat(parameters, "position_y"),
+            ParseInt(parameters, "facing_direction"),
+            movementState);
+    }
+
+    private async Task<bool> ApplyPositionUpdateAsync(Player player, float? positionX, float? positionY, int? facingDirection, string? movementState)
     {
         try
         {
-            if (parameters == null)
-                return false;
-
-            // Update player position and state from parameters
-            if (parameters.TryGetValue("position_x", out var posXStr) && float.TryParse(posXStr, out var positionX))
+            if (positionX.HasValue)
             {
-                player.PositionX = positionX;
-                _logger.LogInformation("Updated player {PlayerName} position X to {PositionX}", player.Name, positionX);
+                player.PositionX = positionX.Value;
+                _logger.LogInformation("Updated player {PlayerName} position X to {PositionX}", player.Name, positionX.Value);
             }
 
-            if (parameters.TryGetValue("position_y", out var posYStr) && float.TryParse(posYStr, out var positionY))
+            if (positionY.HasValue)
             {
-                player.PositionY = positionY;
-                _logger.LogInformation("Updated player {PlayerName} position Y to {PositionY}", player.Name, positionY);
+                player.PositionY = positionY.Value;
+                _logger.LogInformation("Updated player {PlayerName} position Y to {PositionY}", player.Name, positionY.Value);
             }
 
-            if (parameters.TryGetValue("facing_direction", out var facingStr) && int.TryParse(facingStr, out var facingDirection))
+            if (facingDirection.HasValue)
             {
-                player.FacingDirection = facingDirection;
-                _logger.LogInformation("Updated player {PlayerName} facing direction to {FacingDirection}", player.Name, facingDirection);
+                player.FacingDirection = facingDirection.Value;
+                _logger.LogInformation("Updated player {PlayerName} facing direction to {FacingDirection}", player.Name, facingDirection.Value);
             }
 
-            if (parameters.TryGetValue("movement_state", out var movementStr))
+            if (movementState != null)
             {
-                player.MovementState = movementStr;
-                _logger.LogInformation("Updated player {PlayerName} movement state to {MovementState}", player.Name, movementStr);
+                player.MovementState = movementState;
+                _logger.LogInformation("Updated player {PlayerName} movement state to {MovementState}", player.Name, movementState);
             }
 
             // Update LastUpdate timestamp
@@ -45,6 +45,7 @@ public class WorldServiceImpl : WorldService.WorldServiceBase
         try
         {
             var accountId = GetAccountId(context);
+            context.UseGzipResponse();
             var entities = await _worldEntityManager.GetAllEntitiesAsync();
             var response = new GetWorldEntitiesResponse { Timestamp = DateTimeOffset.UtcNow.ToUnixTimeMilliseconds() };
             foreach (var entity in entities)
@@ -82,47 +83,14 @@ public class WorldServiceImpl : WorldService.WorldServiceBase
 
             using var scope = _scopeFactory.CreateScope();
             var dbContext = scope.ServiceProvider.GetRequiredService<GameDbContext>();
-
-            var player = await dbContext.Players.FirstOrDefaultAsync(p => p.AccountId == accountId && p.IsOnline);
-            if (player == null)
-            {
-                throw new RpcException(new Status(StatusCode.NotFound, "Player not found or offline"));
-            }
-
             if (!Guid.TryParse(request.EntityId, out var entityId))
             {
                 throw new RpcException(new Status(StatusCode.InvalidArgument, "Invalid entity ID"));
             }
 
-            var entity = await _worldEntityManager.GetEntityAsync(entityId);
-            if (entity == null)
-            {
-                return new InteractWithEntityResponse { Success = false, Message = "Entity not found" };
-            }
-
-            var result = await ProcessInteraction(player, entity, request.InteractionType, request.Parameters);
-
-            if (result.EntityModified)
-            {
-                await _worldEntityManager.UpdateEntityAsync(entity);
-                await _worldEntityManager.BroadcastEntityUpdateAsync(entity);
-            }
-
-            var response = new InteractWithEntityResponse
-            {
-                Success = result.Success,
-                Message = result.Message
-            };
+            var player = await GetOnlinePlayerAsync(dbContext, accountId);
 
-            if (result.EntityModified)
-            {
-                response.AffectedEntities.Add(MapToProtoWorldEntity(entity));
-            }
-            foreach (var reward in result.Rewards)
-            {
-                response.Rewards[reward.Key] = reward.Value;
-            }
-            return response;
+            return await InteractAsync(player, entityId, request);
         }
         catch (RpcException)
         {
@@ -144,6 +112,7 @@ public class WorldServiceImpl : WorldService.WorldServiceBase
         try
         {
             accountId = GetAccountId(context);
+            context.UseGzipResponse();
             _logger.LogInformation("Starting world updates stream for player account {AccountId}", accountId);
 
             var updateQueue = _worldEntityManager.SubscribeToUpdates();
@@ -198,6 +167,90 @@ public class WorldServiceImpl : WorldService.WorldServiceBase
         }
     }
 
+    public override async Task<BatchInteractResponse> BatchInteract(
+        BatchInteractRequest request,
+        ServerCallContext context)
+    {
+        try
+        {
+            var accountId = GetAccountId(context);
+            _logger.LogInformation("Player {AccountId} batch interacting with {Count} entities",
+                accountId, request.Interactions.Count);
+
+            // Um escopo e uma busca do jogador para o lote inteiro
+            using var scope = _scopeFactory.CreateScope();
+            var dbContext = scope.ServiceProvider.GetRequiredService<GameDbContext>();
+            var player = await GetOnlinePlayerAsync(dbContext, accountId);
+
+            var response = new BatchInteractResponse();
+            foreach (var interaction in request.Interactions)
+            {
+                // ID inválido falha só o próprio item: os já aplicados (e suas recompensas)
+                // continuam na resposta em vez de o lote inteiro virar erro
+                if (!Guid.TryParse(interaction.EntityId, out var entityId))
+                {
+                    response.Results.Add(new InteractWithEntityResponse { Success = false, Message = "Invalid entity ID" });
+                    continue;
+                }
+                // Processadas em ordem: um alvo morto no início do lote já conta para os seguintes
+                response.Results.Add(await InteractAsync(player, entityId, interaction));
+            }
+            return response;
+        }
+        catch (RpcException)
+        {
+            throw;
+        }
+        catch (Exception ex)
+        {
+            _logger.LogError(ex, "Error processing batch entity interaction");
+            throw new RpcException(new Status(StatusCode.Internal, "Failed to process interactions"));
+        }
+    }
+
+    private static async Task<Player> GetOnlinePlayerAsync(GameDbContext dbContext, Guid accountId)
+    {
+        var player = await dbContext.Players.FirstOrDefaultAsync(p => p.AccountId == accountId && p.IsOnline);
+        if (player == null)
+        {
+            throw new RpcException(new Status(StatusCode.NotFound, "Player not found or offline"));
+        }
+        return player;
+    }
+
+    private async Task<InteractWithEntityResponse> InteractAsync(Player player, Guid entityId, InteractWithEntityRequest request)
+    {
+        var entity = await _worldEntityManager.GetEntityAsync(entityId);
+        if (entity == null)
+        {
+            return new InteractWithEntityResponse { Success = false, Message = "Entity not found" };
+        }
+
+        var result = await ProcessInteraction(player, entity, request.InteractionType, request.Parameters);
+
+        if (result.EntityModified)
+        {
+            await _worldEntityManager.UpdateEntityAsync(entity);
+            await _worldEntityManager.BroadcastEntityUpdateAsync(entity);
+        }
+
+        var response = new InteractWithEntityResponse
+        {
+            Success = result.Success,
+            Message = result.Message
+        };
+
+        if (result.EntityModified)
+        {
+            response.AffectedEntities.Add(MapToProtoWorldEntity(entity));
+        }
+        foreach (var reward in result.Rewards)
+        {
+            response.Rewards[reward.Key] = reward.Value;
+        }
+        return response;
+    }
+
     private async Task<InteractionResult> ProcessInteraction(
         Player player,
         ModelWorldEntity entity,
@@ -1,48 +1,47 @@
 #!/usr/bin/env python3
+import logging
 import grpc
+from common_grpc import PLAYER as player_stub, get_token, renew_token
 import player_pb2
-import player_pb2_grpc
-import auth_pb2
-import auth_pb2_grpc
+
+log = logging.getLogger(__name__)
 
 def test_join_world():
     """Teste simples do JoinWorld"""
-    print("=== TESTE JOINWORLD ===")
-    
-    # Conectar ao servidor
-    channel = grpc.insecure_channel('localhost:5001')
-    auth_stub = auth_pb2_grpc.AuthServiceStub(channel)
-    player_stub = player_pb2_grpc.PlayerServiceStub(channel)
+    log.info("=== TESTE JOINWORLD ===")
     
     # 1. Login
-    print("1. Login...")
+    log.info("1. Login...")
     try:
-        login_request = auth_pb2.LoginRequest(
-            email="movetest@test.com",
-            password="password123"
-        )
-        login_response = auth_stub.Login(login_request)
-        if login_response.success:
-            token = login_response.jwt_token
-            print("✅ Login OK")
-        else:
-            print(f"❌ Login falhou: {login_response.message}")
-            return
+        token = get_token()
+        log.info("✅ Login OK")
+    except RuntimeError as e:
+        log.error("❌ Login falhou: %s", e)
+        return
     except Exception as e:
-        print(f"❌ Erro no login: {e}")
+        log.error("❌ Erro no login: %s", e)
         return
     
     # 2. Testar JoinWorld
-    print("2. Testando JoinWorld...")
+    log.info("2. Testando JoinWorld...")
     try:
-        metadata = [('authorization', f'Bearer {token}')]
+        metadata = (('authorization', f'Bearer {token}'),)
         join_request = player_pb2.JoinWorldRequest()
-        join_response = player_stub.JoinWorld(join_request, metadata=metadata)
-        print(f"✅ JoinWorld: {join_response.message}")
+        try:
+            join_response = player_stub.JoinWorld(join_request, metadata=metadata)
+        except grpc.RpcError as e:
+            if e.code() is not grpc.StatusCode.UNAUTHENTICATED:
+                raise
+            token = renew_token()
+            metadata = (('authorization', f'Bearer {token}'),)
+            join_response = player_stub.JoinWorld(join_request, metadata=metadata)
+        log.info("✅ JoinWorld: %s", join_response.message)
+    except RuntimeError as e:
+        log.error("❌ Login falhou: %s", e)
     except grpc.RpcError as e:
-        print(f"❌ Erro JoinWorld: {e.code()} - {e.details()}")
+        log.error("❌ Erro JoinWorld: %s - %s", e.code(), e.details())
     
-    print("Teste concluído!")
+    log.info("Teste concluído!")
 
 if __name__ == "__main__":
     test_join_world()
@@ -1,125 +1,112 @@
 #!/usr/bin/env python3
+import logging
 import grpc
+from common_grpc import aio_stubs, get_token, renew_token
 import player_pb2
-import player_pb2_grpc
-import auth_pb2
-import auth_pb2_grpc
-import time
+import asyncio
 
-def test_complete_movement_flow():
+log = logging.getLogger(__name__)
+
+async def test_complete_movement_flow():
     """Teste completo: login -> personagem -> join world -> movimento real"""
     
-    print("=== TESTE COMPLETO DE MOVIMENTO REAL ===")
-    
-    # Conectar ao servidor
-    channel = grpc.insecure_channel('localhost:5001')
-    auth_stub = auth_pb2_grpc.AuthServiceStub(channel)
-    player_stub = player_pb2_grpc.PlayerServiceStub(channel)
+    log.info("=== TESTE COMPLETO DE MOVIMENTO REAL ===")
     
-    # 1. Login
-    print("1. Fazendo login...")
-    try:
-        login_request = auth_pb2.LoginRequest(
-            email="movetest@test.com",
-            password="password123"
-        )
-        login_response = auth_stub.Login(login_request)
-        if login_response.success:
-            token = login_response.jwt_token
-            print("✅ Login realizado!")
-        else:
-            print(f"❌ Login falhou: {login_response.message}")
+    # Conectar ao servidor (grpc.aio: as esperas não bloqueiam a thread)
+    channel, _, player_stub = aio_stubs()
+    async with channel:
+        # 1. Login
+        log.info("1. Fazendo login...")
+        try:
+            token = get_token()
+            log.info("✅ Login realizado!")
+        except RuntimeError as e:
+            log.error("❌ Login falhou: %s", e)
+            return
+        except Exception as e:
+            log.error("❌ Erro no login: %s", e)
             return
-    except Exception as e:
-        print(f"❌ Erro no login: {e}")
-        return
-    
-    # 2. Listar personagens
-    print("2. Listando personagens...")
-    try:
-        metadata = [('authorization', f'Bearer {token}')]
-        list_request = player_pb2.ListCharactersRequest()
-        list_response = player_stub.ListCharacters(list_request, metadata=metadata)
         
-        if list_response.players:
-            character = list_response.players[0]
-            print(f"✅ Usando personagem: {character.name}")
-            print(f"   Posição inicial: ({character.position_x}, {character.position_y})")
-            print(f"   Online: {character.is_online}")
-        else:
-            print("❌ Nenhum personagem encontrado")
+        # 2. Entrar no mundo (JoinWorld) - sem player_id usa o primeiro personagem;
+        # a resposta já traz o personagem, dispensando um ListCharacters antes
+        log.info("2. Entrando no mundo...")
+        metadata = (('authorization', f'Bearer {token}'),)
+        list_request = player_pb2.ListCharactersRequest()
+        try:
+            join_request = player_pb2.JoinWorldRequest()  # Sem player_id
+            try:
+                join_response = await player_stub.JoinWorld(join_request, metadata=metadata)
+            except grpc.RpcError as e:
+                if e.code() is not grpc.StatusCode.UNAUTHENTICATED:
+                    raise
+                token = await asyncio.to_thread(renew_token)
+                metadata = (('authorization', f'Bearer {token}'),)
+                join_response = await player_stub.JoinWorld(join_request, metadata=metadata)
+            if join_response.success:
+                character = join_response.player
+                start_pos = (character.position_x, character.position_y)
+                log.info("✅ Entrou no mundo: %s", join_response.message)
+                log.info("✅ Usando personagem: %s", character.name)
+                log.info("   Posição inicial: (%s, %s)", *start_pos)
+                log.info("   Online: %s", character.is_online)
+            else:
+                log.error("❌ Falha ao entrar no mundo: %s", join_response.message)
+                return
+        except RuntimeError as e:
+            log.error("❌ Login falhou: %s", e)
             return
-    except grpc.RpcError as e:
-        print(f"❌ Erro ao listar personagens: {e.details()}")
-        return
-    
-    # 3. Entrar no mundo (JoinWorld) - sem especificar player_id para usar o primeiro
-    print("3. Entrando no mundo...")
-    try:
-        join_request = player_pb2.JoinWorldRequest()  # Sem player_id
-        join_response = player_stub.JoinWorld(join_request, metadata=metadata)
-        if join_response.success:
-            print(f"✅ Entrou no mundo: {join_response.message}")
-            if join_response.player:
-                print(f"   Player: {join_response.player.name} at ({join_response.player.position_x}, {join_response.player.position_y})")
-                print(f"   Online: {join_response.player.is_online}")
-        else:
-            print(f"❌ Falha ao entrar no mundo: {join_response.message}")
+        except grpc.RpcError as e:
+            log.error("❌ Erro ao entrar no mundo: %s - %s", e.code(), e.details())
             return
-    except grpc.RpcError as e:
-        print(f"❌ Erro ao entrar no mundo: {e.code()} - {e.details()}")
-        return
-    
-    # 4. Série de movimentos
-    print("4. Testando movimentos...")
-    movements = [
-        (100.0, 50.0, "walk"),
-        (200.0, 100.0, "run"),
-        (150.0, 200.0, "walk"),
-        (50.0, 150.0, "run")
-    ]
-    
-    for i, (target_x, target_y, movement_type) in enumerate(movements, 1):
-        print(f"   {i}. Movimento para ({target_x}, {target_y}) - {movement_type}")
+        
+        # 3. Série de movimentos
+        log.info("3. Testando movimentos...")
+        movements = [
+            (100.0, 50.0, "walk"),
+            (200.0, 100.0, "run"),
+            (150.0, 200.0, "walk"),
+            (50.0, 150.0, "run")
+        ]
+        
+        move_request = player_pb2.PlayerMoveRequest()
+        for i, (target_x, target_y, movement_type) in enumerate(movements, 1):
+            log.info("   %s. Movimento para (%s, %s) - %s", i, target_x, target_y, movement_type)
+            try:
+                move_request.target_x = target_x
+                move_request.target_y = target_y
+                move_request.movement_type = movement_type
+                move_response = await player_stub.MovePlayer(move_request, metadata=metadata)
+                if move_response.success:
+                    log.info("      ✅ %s", move_response.message)
+                else:
+                    log.error("      ❌ Falha: %s", move_response.message)
+            except grpc.RpcError as e:
+                log.error("      ❌ Erro: %s - %s", e.code(), e.details())
+        
+        # 4. Verificar posição final
+        log.info("4. Verificando posição final...")
         try:
-            move_request = player_pb2.PlayerMoveRequest(
-                target_x=target_x,
-                target_y=target_y,
-                movement_type=movement_type
-            )
-            move_response = player_stub.MovePlayer(move_request, metadata=metadata)
-            if move_response.success:
-                print(f"      ✅ {move_response.message}")
-            else:
-                print(f"      ❌ Falha: {move_response.message}")
+            list_response = await player_stub.ListCharacters(list_request, metadata=metadata)
+            if list_response.players:
+                # Campos lidos uma vez; o resto do bloco usa só as variáveis locais
+                fc = list_response.players[0]
+                final_pos = (fc.position_x, fc.position_y)
+                moved = final_pos != start_pos
+                log.info("   Posição final: (%s, %s)", *final_pos)
+                log.info("   Estado: %s", fc.movement_state)
+                log.info("   Direção: %s", fc.facing_direction)
+                log.info("   Online: %s", fc.is_online)
+                
+                # Verificar se a posição mudou
+                if moved:
+                    log.info("🎉 Personagem se moveu com sucesso!")
+                    log.info("🎉 Movimento total: (%s, %s) → (%s, %s)", *start_pos, *final_pos)
+                else:
+                    log.warning("⚠️  Personagem não se moveu (posição não mudou)")
         except grpc.RpcError as e:
-            print(f"      ❌ Erro: {e.code()} - {e.details()}")
+            log.error("❌ Erro ao verificar posição: %s", e.details())
         
-        # Pequeno delay entre movimentos
-        time.sleep(0.5)
-    
-    # 5. Verificar posição final
-    print("5. Verificando posição final...")
-    try:
-        list_response = player_stub.ListCharacters(list_request, metadata=metadata)
-        if list_response.players:
-            final_character = list_response.players[0]
-            print(f"   Posição final: ({final_character.position_x}, {final_character.position_y})")
-            print(f"   Estado: {final_character.movement_state}")
-            print(f"   Direção: {final_character.facing_direction}")
-            print(f"   Online: {final_character.is_online}")
-            
-            # Verificar se a posição mudou
-            if (final_character.position_x != character.position_x or 
-                final_character.position_y != character.position_y):
-                print("🎉 Personagem se moveu com sucesso!")
-                print(f"🎉 Movimento total: ({character.position_x}, {character.position_y}) → ({final_character.position_x}, {final_character.position_y})")
-            else:
-                print("⚠️  Personagem não se moveu (posição não mudou)")
-    except grpc.RpcError as e:
-        print(f"❌ Erro ao verificar posição: {e.details()}")
-    
-    print("\n🎮 Teste de movimento concluído!")
+        log.info("\n🎮 Teste de movimento concluído!")
 
 if __name__ == "__main__":
-    test_complete_movement_flow()
+    asyncio.run(test_complete_movement_flow())
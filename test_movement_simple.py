@@ -1,52 +1,52 @@
 #!/usr/bin/env python3
+import logging
 import grpc
+from common_grpc import PLAYER as player_stub, get_token, renew_token
 import player_pb2
-import player_pb2_grpc
-import auth_pb2
-import auth_pb2_grpc
+
+log = logging.getLogger(__name__)
 
 def test_movement_simple():
     """Teste simples de movimento"""
-    print("=== TESTE MOVIMENTO SIMPLES ===")
-    
-    # Conectar ao servidor
-    channel = grpc.insecure_channel('localhost:5001')
-    auth_stub = auth_pb2_grpc.AuthServiceStub(channel)
-    player_stub = player_pb2_grpc.PlayerServiceStub(channel)
+    log.info("=== TESTE MOVIMENTO SIMPLES ===")
     
     # 1. Login
-    print("1. Login...")
+    log.info("1. Login...")
     try:
-        login_request = auth_pb2.LoginRequest(
-            email="movetest@test.com",
-            password="password123"
-        )
-        login_response = auth_stub.Login(login_request)
-        if login_response.success:
-            token = login_response.jwt_token
-            print("✅ Login OK")
-        else:
-            print(f"❌ Login falhou: {login_response.message}")
-            return
+        token = get_token()
+        log.info("✅ Login OK")
+    except RuntimeError as e:
+        log.error("❌ Login falhou: %s", e)
+        return
     except Exception as e:
-        print(f"❌ Erro no login: {e}")
+        log.error("❌ Erro no login: %s", e)
         return
     
     # 2. Metadata para autenticação
-    metadata = [('authorization', f'Bearer {token}')]
+    metadata = (('authorization', f'Bearer {token}'),)
     
     # 3. JoinWorld
-    print("2. JoinWorld...")
+    log.info("2. JoinWorld...")
     try:
         join_request = player_pb2.JoinWorldRequest()
-        join_response = player_stub.JoinWorld(join_request, metadata=metadata)
-        print(f"✅ JoinWorld: {join_response.message}")
+        try:
+            join_response = player_stub.JoinWorld(join_request, metadata=metadata)
+        except grpc.RpcError as e:
+            if e.code() is not grpc.StatusCode.UNAUTHENTICATED:
+                raise
+            token = renew_token()
+            metadata = (('authorization', f'Bearer {token}'),)
+            join_response = player_stub.JoinWorld(join_request, metadata=metadata)
+        log.info("✅ JoinWorld: %s", join_response.message)
+    except RuntimeError as e:
+        log.error("❌ Login falhou: %s", e)
+        return
     except grpc.RpcError as e:
-        print(f"❌ Erro JoinWorld: {e.code()} - {e.details()}")
+        log.error("❌ Erro JoinWorld: %s - %s", e.code(), e.details())
         return
     
     # 4. Movimento
-    print("3. Movimento...")
+    log.info("3. Movimento...")
     try:
         move_request = player_pb2.PlayerMoveRequest(
             target_x=100.0,
@@ -55,27 +55,27 @@ def test_movement_simple():
         )
         move_response = player_stub.MovePlayer(move_request, metadata=metadata)
         if move_response.success:
-            print(f"✅ Movimento: {move_response.message}")
+            log.info("✅ Movimento: %s", move_response.message)
         else:
-            print(f"❌ Movimento falhou: {move_response.message}")
+            log.error("❌ Movimento falhou: %s", move_response.message)
     except grpc.RpcError as e:
-        print(f"❌ Erro movimento: {e.code()} - {e.details()}")
+        log.error("❌ Erro movimento: %s - %s", e.code(), e.details())
     
     # 5. Verificar posição
-    print("4. Verificar posição...")
+    log.info("4. Verificar posição...")
     try:
         list_request = player_pb2.ListCharactersRequest()
         list_response = player_stub.ListCharacters(list_request, metadata=metadata)
         if list_response.players:
             player = list_response.players[0]
-            print(f"✅ Posição: ({player.position_x}, {player.position_y})")
-            print(f"   Estado: {player.movement_state}")
-            print(f"   Direção: {player.facing_direction}")
-            print(f"   Online: {player.is_online}")
+            log.info("✅ Posição: (%s, %s)", player.position_x, player.position_y)
+            log.info("   Estado: %s", player.movement_state)
+            log.info("   Direção: %s", player.facing_direction)
+            log.info("   Online: %s", player.is_online)
     except grpc.RpcError as e:
-        print(f"❌ Erro verificar: {e.details()}")
+        log.error("❌ Erro verificar: %s", e.details())
     
-    print("Teste concluído!")
+    log.info("Teste concluído!")
 
 if __name__ == "__main__":
     test_movement_simple()
@@ -1,75 +1,92 @@
 #!/usr/bin/env python3
+import logging
+import asyncio
 import grpc
+from common_grpc import aio_stubs, get_token, renew_token
 import player_pb2
-import player_pb2_grpc
-import auth_pb2
-import auth_pb2_grpc
-import time
 
-def test_multiple_movements():
+log = logging.getLogger(__name__)
+
+DIRS = ("North", "East", "South", "West")
+
+# Sequência de movimentos
+MOVEMENTS = (
+    (50, 50, "walk"),
+    (150, 100, "run"),
+    (300, 200, "walk"),
+    (250, 350, "run"),
+    (100, 300, "walk")
+)
+
+# Requests montados uma vez no import; o loop só os envia
+MOVE_REQS = tuple(
+    player_pb2.PlayerMoveRequest(target_x=float(x), target_y=float(y), movement_type=move_type)
+    for x, y, move_type in MOVEMENTS
+)
+
+def _describe_position(state):
+    """Posição/direção/estado de um PlayerMoveResponse ou PlayerInfo"""
+    facing = state.facing_direction
+    direction_name = DIRS[facing] if 0 <= facing < 4 else "Unknown"
+    return f"({state.position_x}, {state.position_y}) facing {direction_name} ({state.movement_state})"
+
+async def test_multiple_movements():
     """Teste com múltiplos movimentos"""
-    print("=== TESTE MÚLTIPLOS MOVIMENTOS ===")
-    
-    # Conectar ao servidor
-    channel = grpc.insecure_channel('localhost:5001')
-    auth_stub = auth_pb2_grpc.AuthServiceStub(channel)
-    player_stub = player_pb2_grpc.PlayerServiceStub(channel)
-    
-    # Login
-    login_request = auth_pb2.LoginRequest(
-        email="movetest@test.com",
-        password="password123"
-    )
-    login_response = auth_stub.Login(login_request)
-    token = login_response.jwt_token
-    metadata = [('authorization', f'Bearer {token}')]
-    
-    # JoinWorld
-    join_request = player_pb2.JoinWorldRequest()
-    join_response = player_stub.JoinWorld(join_request, metadata=metadata)
-    print(f"🌍 {join_response.message}")
-    
-    # Sequência de movimentos
-    movements = [
-        (50, 50, "walk"),
-        (150, 100, "run"),
-        (300, 200, "walk"),
-        (250, 350, "run"),
-        (100, 300, "walk")
-    ]
+    log.info("=== TESTE MÚLTIPLOS MOVIMENTOS ===")
     
-    print(f"\n🎮 Iniciando sequência de {len(movements)} movimentos:")
-    
-    for i, (x, y, move_type) in enumerate(movements, 1):
-        print(f"\n  {i}. Movendo para ({x}, {y}) - {move_type}")
-        
-        move_request = player_pb2.PlayerMoveRequest(
-            target_x=float(x),
-            target_y=float(y),
-            movement_type=move_type
-        )
+    # Conectar ao servidor (grpc.aio: as esperas não bloqueiam a thread)
+    channel, _, player_stub = aio_stubs()
+    async with channel:
+        # Login (JWT em cache entre execuções)
+        token = get_token()
+        # Header e requests montados uma vez e reaproveitados em todas as chamadas
+        metadata = (('authorization', f'Bearer {token}'),)
+        list_request = player_pb2.ListCharactersRequest()
         
+        # JoinWorld
+        join_request = player_pb2.JoinWorldRequest()
         try:
-            move_response = player_stub.MovePlayer(move_request, metadata=metadata)
-            if move_response.success:
-                print(f"     ✅ {move_response.message}")
-            else:
-                print(f"     ❌ {move_response.message}")
+            join_response = await player_stub.JoinWorld(join_request, metadata=metadata)
         except grpc.RpcError as e:
-            print(f"     ❌ Erro: {e.details()}")
+            if e.code() is not grpc.StatusCode.UNAUTHENTICATED:
+                raise
+            token = await asyncio.to_thread(renew_token)
+            metadata = (('authorization', f'Bearer {token}'),)
+            join_response = await player_stub.JoinWorld(join_request, metadata=metadata)
+        log.info("🌍 %s", join_response.message)
         
-        # Verificar posição atual
-        list_request = player_pb2.ListCharactersRequest()
-        list_response = player_stub.ListCharacters(list_request, metadata=metadata)
-        if list_response.players:
-            player = list_response.players[0]
-            directions = ["North", "East", "South", "West"]
-            direction_name = directions[player.facing_direction] if 0 <= player.facing_direction < 4 else "Unknown"
-            print(f"     📍 Real: ({player.position_x}, {player.position_y}) facing {direction_name} ({player.movement_state})")
+        log.info("\n🎮 Iniciando sequência de %s movimentos:", len(MOVEMENTS))
+        
+        # Em ordem: cada movimento parte da posição deixada pelo anterior.
+        # O loop só faz as RPCs; o relatório é formatado depois dele
+        results = []
+        for move_request in MOVE_REQS:
+            try:
+                results.append(await player_stub.MovePlayer(move_request, metadata=metadata))
+            except grpc.RpcError as e:
+                results.append(e)
         
-        time.sleep(1)  # Pequena pausa entre movimentos
+        # Relatório só é montado se o nível INFO estiver ativo (LOGLEVEL=WARNING pula)
+        if log.isEnabledFor(logging.INFO):
+            lines = []
+            for i, ((x, y, move_type), result) in enumerate(zip(MOVEMENTS, results), 1):
+                lines.append(f"\n  {i}. Movendo para ({x}, {y}) - {move_type}")
+                if isinstance(result, grpc.RpcError):
+                    lines.append(f"     ❌ Erro: {result.details()}")
+                elif result.success:
+                    lines.append(f"     ✅ {result.message}")
+                    # Posição atual já vem na resposta do movimento
+                    lines.append(f"     📍 Real: {_describe_position(result)}")
+                else:
+                    lines.append(f"     ❌ {result.message}")
+            log.info("\n".join(lines))
+        
+        # Verificar posição final persistida
+        list_response = await player_stub.ListCharacters(list_request, metadata=metadata)
+        if list_response.players:
+            log.info("\n📍 Final: %s", _describe_position(list_response.players[0]))
     
-    print(f"\n🎉 Teste de múltiplos movimentos concluído!")
+    log.info("\n🎉 Teste de múltiplos movimentos concluído!")
 
 if __name__ == "__main__":
-    test_multiple_movements()
+    asyncio.run(test_multiple_movements())
@@ -3,15 +3,14 @@
 Teste de sincronização com o servidor sem interface gráfica
 """
 
+import logging
 import sys
 import os
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src', 'GameClient'))
 
-# Adicionar o diretório GameClient ao path
-client_path = os.path.join(os.path.dirname(__file__), 'src', 'GameClient')
-sys.path.insert(0, client_path)
+# Uma única entrada no path (src); o cliente é importado pelo pacote, como no main.py
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
 
-from grpc_client import grpc_client
+from GameClient.grpc_client import grpc_client
 import time
 
 def test_server_connection():
@@ -22,6 +21,10 @@ def test_server_connection():
         # Teste de login
         print("1. Testando registro de conta...")
         grpc_client.connect()
+        # connect() repetido não pode abrir outro canal: todo o teste usa a mesma conexão
+        channel = grpc_client.channel
+        grpc_client.connect()
+        assert grpc_client.channel is channel, "connect() criou um novo canal"
         
         # Registrar nova conta
         response = grpc_client.register("testuser@test.com", "testpass123")
@@ -111,4 +114,6 @@ def test_server_connection():
         grpc_client.close()
 
 if __name__ == "__main__":
+    # Mostra também as mensagens do grpc_client
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     test_server_connection()